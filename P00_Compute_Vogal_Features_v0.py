@@ -13,7 +13,7 @@ tel: +55 31 98801-3605
 --- 
 Rotina para a leitura de arquivos do tipo .TextgGrid (praat) e calculo de 
 taxas espectrais como:
-1 - HNR (de Signal_Analysis.features.signal)
+1 - HNR (utils/hnr.py, mesmo cálculo de get_HNR de Signal_Analysis.features.signal)
 2 - centro de gravidade espectral do tipo 1, 2 e 2/3, (vide link abaixo) e
 
 Centro de gravidade praat:
@@ -28,21 +28,37 @@ Livre para uso e modificações.
 Em caso de dúvidas entre em contato.
 """
 from utils.file_utils import list_contend, textgrid_to_interval_matrix, spectral_ratios
-from scipy.io import wavfile
-from Signal_Analysis.features.signal import get_HNR
 import numpy as np
 from pathlib import Path
 import sys
 import os
+import glob
+import time
+from concurrent.futures import ProcessPoolExecutor
 # import praat_formants_python as pfp
-from utils.formant_lpc import format_lpc, intensity
-from g2p.g2p import G2PTranscriber
+from utils.formant_lpc import format_lpc, intensity, mean_formant
+from utils.tracks import FeatureTracks, TRACK_HNR_NOTE
+from utils.audio import AudioReader
+from utils.hnr import get_hnr
+from utils.instrument import Instrument, build_report, write_report
+from utils.rejections import RejectionLog, REJECTION_HEADER, count_rejections, rejection_summary
+from utils.results import ResultCache, code_version
+from utils.writers import TsvWriter, ParquetWriter
+from g2p.service import TranscriptionService
+from g2p.g2p import get_prefix_matcher, get_homographs_heterophones
+from g2p.lexicon import Lexicon
+from collections import namedtuple, Counter
 import re
 import warnings
-from unidecode import unidecode
+from functools import lru_cache
 warnings.filterwarnings("ignore")
 
-abdist = np.genfromtxt ('dst_alfabeto.csv', delimiter=",")
+# A tabela de distâncias e o unidecode só são carregados no primeiro uso, uma
+# vez por processo, e não na importação
+@lru_cache(maxsize=None)
+def alphabet_distances():
+    return np.genfromtxt ('dst_alfabeto.csv', delimiter=",")
+
 ab_list=[]
 for i in range(97,123):
     ab_list.append(chr(i))
@@ -69,9 +85,10 @@ ajusta algumas semelhanças como:
     dist_of_letters('u','a') = 1
 '''
 def dist_of_letters(L1,L2):
+    from unidecode import unidecode
     idxL1 = ab_list.index(unidecode(L1).lower())
     idxL2 = ab_list.index(unidecode(L2).lower())
-    return abdist[idxL1,idxL2]
+    return alphabet_distances()[idxL1,idxL2]
 # -----------------------------------------------------------------------------
 '''
 Calcula a media de uma serie no tamanho percentual do intervalo. 
@@ -119,7 +136,8 @@ def tag_to_bass_vowel(tag, idTag):
         idxb = vogal_idx[idxg]
         return vogal_bas[idxb], idxb
     except:
-        print("Erro convert vowel: TAG {:}. ID: {:}".format(tag,idTag))
+        if (VERBOSE):
+            print("Erro convert vowel: TAG {:}. ID: {:}".format(tag,idTag))
         return '0', -1
 # -----------------------------------------------------------------------------
 '''
@@ -127,12 +145,14 @@ def tag_to_bass_vowel(tag, idTag):
     "distancia" entre as letras.
 '''
 def find_pos_of_tag(mSilabe,mTag):
+    from unidecode import unidecode
     mSilabe = unidecode(mSilabe).lower()
     mTag = unidecode(mTag).lower()
     nSil = len(mSilabe)
     nTag = len(mTag)
     if (nTag > nSil):
-        print("Problema com tamanho da marcaçao Silaba: {:}, TAG {:}".format(mSilabe,mTag))
+        if (VERBOSE):
+            print("Problema com tamanho da marcaçao Silaba: {:}, TAG {:}".format(mSilabe,mTag))
         return -1, 1
     vDist = np.zeros((nSil-nTag+1,))
     for i in range(0,nSil-nTag+1):
@@ -172,13 +192,15 @@ def pos_indicated_vowel(phono, vowel, idTag):
                 v_pos = np.append(v_pos, i)
                 v_dist = np.append(v_dist, tabBasPhono[i_bas,i_pho])
             except:
-                print("Erro find vowel {:}. ID: {:}".format(g,idTag))
+                if (VERBOSE):
+                    print("Erro find vowel {:}. ID: {:}".format(g,idTag))
             
     u_pos = np.unique(v_pos)
     if (len(u_pos) == 1):
         return int(u_pos[0])
     elif (len(u_pos) == 0):
-        print("Erro: ID: {:}".format(idTag))
+        if (VERBOSE):
+            print("Erro: ID: {:}".format(idTag))
     else:
         u_dist = 5*np.ones(u_pos.shape)
         for i, u in enumerate(u_pos):
@@ -203,7 +225,8 @@ def estimate_syllabe_position(phonografico, numSyl, posVogal):
         return returnValue
     
     # posicao da tónica do final da palavra (direita) para i início (esquerda)
-    stressPos = numSyl - np.array(["ˈ" in parte[j] for parte in phonPalavra]).nonzero()[0][0] - 1
+    # Marca de tonicidade no primeiro caractere da sílaba, como na versão original
+    stressPos = numSyl - np.array(["ˈ" in parte[0] for parte in phonografico]).nonzero()[0][0] - 1
     
     if(stressPos < 3):
         if (posVogal == 0):
@@ -214,19 +237,12 @@ def estimate_syllabe_position(phonografico, numSyl, posVogal):
         elif (posVogal > 2):    
             returnValue = (numSyl - posVogal + 1 - stressPos)    
     else:
-        print("9: Sílaba tónica em posição {:}, diferente da esperada.".format(stressPos))
+        if (VERBOSE):
+            print("9: Sílaba tónica em posição {:}, diferente da esperada.".format(stressPos))
     
     return returnValue
 # -----------------------------------------------------------------------------
 
-AUDIO_FOLDER = '../Audios/'
-CSVFILE = './csvDataAudios.csv'
-audiofiles = list_contend(folder=AUDIO_FOLDER, pattern=('.wav',))
-textgridfiles = list_contend(folder=AUDIO_FOLDER, pattern=('.textgrid',))
-
-if (len(audiofiles) != len(textgridfiles)):
-    print("Erro: número de arquivos de áudio não corresponde ao numero de TextGrid")
-
 # Tamanho do passo de tempo em segundos
 valStep = 0.005
 valWin  = 0.020
@@ -236,37 +252,59 @@ list_phon_vowels = ("a", "e", "o", "á", "é", "í", "ó", "ú", "ã", "õ", "â
 
 list_phon_consonant = ('b','c','d','f','g','h','j','k','l','m','n','p','q','r','s','t','v','w','x','y','z','ʃ', 'ʎ', 'ɲ', 'ɳ', 'ɾ', 'ɣ', 'ʒ', 'ʤ', 'ʧ', 'ŋ')
 
-csvLines = []
-strTitle = "ID, Duração, F1, F2, F1_b, F2_b, intensidade, tag, Posiçao, HNR, Fonetica, Fonologica, Ditongo, Palavra, Tonicidade, Precedente, Seguinte, Fechada, Silabas, Oral, LetraPre, LetraSeg, Sexo, Arquivo\n".replace(",","\t")
-csvLines.append(strTitle)
+strTitle = "ID, Duração, F1, F2, F1_b, F2_b, intensidade, tag, Posiçao, HNR, Fonetica, Fonologica, Ditongo, Palavra, Tonicidade, Precedente, Seguinte, Fechada, Silabas, Oral, LetraPre, LetraSeg, Sexo, Arquivo".split(", ")
+# Tipos das colunas na saída Parquet (utils/writers.py)
+strTypes = ['int64', 'float64', 'float32', 'float32', 'float32', 'float32', 'float32', 'category', 'int16',
+            'float32', 'category', 'category', 'int8', 'category', 'category', 'category', 'category', 'int8',
+            'int16', 'int8', 'category', 'category', 'category', 'category']
 useTiers = (0,)
-tabId = 0;
-maxNSyllab = 0
-
-for idxtg, tgFile in enumerate(textgridfiles):
-    value = textgrid_to_interval_matrix(tgFile)    
-    sr, audio = wavfile.read(audiofiles[idxtg])
+# Léxico em disco com as transcrições G2P, compartilhado entre execuções e
+# processos (None = desativado). É invalidado quando as regras mudam.
+# Desativado por padrão: importar este módulo não cria arquivos no diretório
+# atual. Para usar, indique o arquivo, ex.: './g2p_lexicon.sqlite'
+LEXICON_FILE = None
+# Transcrições memorizadas, uma instância por processo
+g2pService = TranscriptionService(algorithm='ceci', lexicon=Lexicon(LEXICON_FILE) if LEXICON_FILE else None)
+# Resultado de process_file para um par (TextGrid, WAV)
+FileResult = namedtuple('FileResult', ['rows', 'maxNSyllab', 'g2pHits', 'g2pMisses', 'stats', 'rejections'])
+# -----------------------------------------------------------------------------
+'''
+Processa um par (TextGrid, WAV) e retorna um FileResult com as linhas de 
+características de cada intervalo aceito, ainda sem o ID, o maior número de 
+sílabas encontrado, os acertos/falhas do cache de transcrição no arquivo e, 
+com INSTRUMENT ativo, as medidas de tempo por etapa (utils/instrument.py).
+Os intervalos descartados são registrados com o código do motivo 
+(utils/rejections.py); neles o ID é o índice do intervalo na camada.
+'''
+def process_file(tgFile, audioFile):
+    rows = []
+    maxNSyllab = 0
+    g2pHits, g2pMisses = g2pService.hits, g2pService.misses
+    inst = Instrument(INSTRUMENT)
+    rejects = RejectionLog(Path(tgFile).name, VERBOSE)
+    tFile = time.perf_counter()
+    with inst.stage('textgrid'):
+        value = textgrid_to_interval_matrix(tgFile,tiers=useTiers)
+    # Audio mapeado em memoria: so os trechos usados sao lidos e normalizados
+    with inst.stage('wav_open'):
+        audio = AudioReader(audioFile)
+    sr = audio.sr
     tabSexo = tgFile[-15]
     tabFileName = tgFile.split("/")[-1].split(".")[0]
-    if (len(audio.shape) > 1):
-        nSamples, nChannel = audio.shape
-    else:
-        nSamples  = len(audio)
-        nChannel  = 1
-    if (nChannel > 1):
-        audio = np.mean(audio,axis = 1)
-    audio = audio/np.max(np.abs(audio))
+    if (TRACK_MODE):
+        with inst.stage('tracks'):
+            tracks = FeatureTracks(audio,sr,winstep=valStep,winlen=valWin)
         
     for j in useTiers:
         intervalMtx = value[j]    
         for idxL, interval in enumerate(intervalMtx):
+            inst.count('intervals')
             tabDitongo = 0
             nIni = int(interval[0]*sr)
             nFim = int(interval[1]*sr)
             tabDuration = interval[1] - interval[0]
             if (tabDuration < (valWin + valStep)):
-                print("1: Segmento ID {:} de {:} seg é muito pequeno para processamento.".format(tabId,tabDuration))
-                print("1: Arquivo {:} no intervalo entre {:2.3f} e {:2.3f} segundos.".format(Path(tgFile).name,interval[0],interval[1]))
+                rejects.add(1,idxL,interval,"{:2.3f} s".format(tabDuration))
                 continue
                 
             tags = interval[2].split("-")
@@ -284,8 +322,7 @@ for idxtg, tgFile in enumerate(textgridfiles):
             tags[0] = tags[0].replace(" ","")
             
             if not (len(tags) == 5):
-                print("2: Etiqueta {:} ID {:} com problema no número de marcações.".format(interval[2],tabId))
-                print("2: Arquivo {:} no intervalo entre {:2.3f} e {:2.3f} segundos.".format(Path(tgFile).name,interval[0],interval[1]))
+                rejects.add(2,idxL,interval)
                 continue
             if (len(tags[2]) > 0):
                 try:
@@ -293,66 +330,76 @@ for idxtg, tgFile in enumerate(textgridfiles):
                     if (nSib > maxNSyllab):
                         maxNSyllab = nSib
                 except:
-                    print("9: Problema com a TAG 2 como {:} de ID {:} ".format(tags[2],tabId))
+                    rejects.add(9,idxL,interval,tags[2])
                     continue
             else:
+                rejects.add(10,idxL,interval)
                 continue
                     
             tabFonetica = tags[0]
             if (len(tabFonetica) == 1) and (tabFonetica.lower() in listConsoante):
-                print("2: Etiqueta {:} ID {:} apresenta tag que nao e vogal {:}.".format(interval[2],tabId,tabFonetica))
+                rejects.add(8,idxL,interval,tabFonetica)
                 continue
             
             tabPalavra = tags[1]
             tabTonicidade = tags[3]
             tabDitongo = is_ditongo(tags[0])
                             
-            selAudio = audio[nIni:nFim]
-            form2, _ = format_lpc(selAudio,sr,winstep=valStep,winlen=valWin)
-            inten = intensity(selAudio,sr,winstep=valStep,winlen=valWin)
-            try:
-                tabMeanHNR, _ = get_HNR(selAudio,sr,time_step=valStep,periods_per_window = 1.875)
-            except:
-                tabMeanHNR = 0;
+            if (TRACK_MODE):
+                form2, _ = tracks.formants(interval[0],interval[1])
+                inten = tracks.intensity(interval[0],interval[1])
+                hnr = tracks.hnr(interval[0],interval[1])
+            else:
+                with inst.stage('wav_read'):
+                    selAudio = audio.segment(nIni,nFim)
+                with inst.stage('format_lpc'):
+                    form2, _ = format_lpc(selAudio,sr,winstep=valStep,winlen=valWin)
+                with inst.stage('intensity'):
+                    inten = intensity(selAudio,sr,winstep=valStep,winlen=valWin)
+                with inst.stage('hnr'):
+                    hnr = get_hnr(selAudio,sr,time_step=valStep,periods_per_window = 1.875)
+            # HNR = 0 para trechos surdos; descarta só os que não podem ser analisados
+            tabMeanHNR = hnr.value
+            if (tabMeanHNR is None):
+                rejects.add(3,idxL,interval,hnr.reason)
                 continue
             tabIntensity = getMeanPercentualInterval(inten,0.2,0.8)
+            # Formantes: media so dos quadros com formante (utils/formant_lpc.py)
             if (tabDitongo == 0):
-                tabF1 = getMeanPercentualInterval(form2[0,:],0.2,0.8)
-                tabF2 = getMeanPercentualInterval(form2[1,:],0.2,0.8)
+                tabF1 = mean_formant(form2[0,:],0.2,0.8)
+                tabF2 = mean_formant(form2[1,:],0.2,0.8)
                 tabF1_b = -1
                 tabF2_b = -1
             else:
-                tabF1 = getMeanPercentualInterval(form2[0,:],0.1,0.2)
-                tabF2 = getMeanPercentualInterval(form2[1,:],0.1,0.2)
-                tabF1_b = getMeanPercentualInterval(form2[0,:],0.8,0.9)
-                tabF2_b = getMeanPercentualInterval(form2[1,:],0.8,0.9)
+                tabF1 = mean_formant(form2[0,:],0.1,0.2)
+                tabF2 = mean_formant(form2[1,:],0.1,0.2)
+                tabF1_b = mean_formant(form2[0,:],0.8,0.9)
+                tabF2_b = mean_formant(form2[1,:],0.8,0.9)
             
             # momento da transcricao groafica para fonetica
-            g2p = G2PTranscriber(tabPalavra, algorithm='ceci')
-            phonPalavra = g2p.transcriber().split(",")[0].split('.')
-            grafPalavra = g2p.get_syllables_with_hyphen().split('-')
+            with inst.stage('g2p'):
+                g2p = g2pService.transcribe(tabPalavra)
+            phonPalavra = g2p.phonemes.split(",")[0].split('.')
+            grafPalavra = g2p.syllables.split('-')
             
             if (len(grafPalavra) != len(phonPalavra)):
                 phonPalavra = phonPalavra[:(len(grafPalavra)-1)]
             
             if (len(grafPalavra) != int(tags[2])):
-                print('4: ID {:}. Problema na silabificação (tag {:}) de \"{:}\" como {:} , {:}'.format(tabId,int(tags[2]),tabPalavra,phonPalavra, grafPalavra))
-                print("4: Arquivo {:} no intervalo entre {:2.3f} e {:2.3f} segundos.".format(Path(tgFile).name,interval[0],interval[1]))
+                rejects.add(4,idxL,interval,"{:} como {:} , {:}".format(tabPalavra,'.'.join(phonPalavra),'-'.join(grafPalavra)))
                 continue
             try:
                 sibPosition = int(tags[4])
                 if (int(tags[4]) >  len(grafPalavra)):
-                    print("5: Etiqueta {:} ID {:} com problema. Possicao maior que o numero de silabas".format(interval[2],tabId))
-                    print("5: Arquivo {:} no intervalo entre {:2.3f} e {:2.3f} segundos.".format(Path(tgFile).name,interval[0],interval[1]))
+                    rejects.add(5,idxL,interval)
                     continue
             except:
-                print("9: Problema com a TAG 4 como {:} de ID {:} ".format(tags[4],tabId))
+                rejects.add(11,idxL,interval,tags[4])
                 continue
             
             vogalPos = estimate_syllabe_position(phonPalavra,int(tags[2]),int(tags[4]))
             if (vogalPos < 0):
-                print("6: Etiqueta {:} ID {:} com problema. Falha na estimaçao da posiçao da silaba".format(interval[2],tabId))
-                print("6: Arquivo {:} no intervalo entre {:2.3f} e {:2.3f} segundos.".format(Path(tgFile).name,interval[0],interval[1]))
+                rejects.add(6,idxL,interval)
                 continue
             
             # remove o marcador de silaba tonica
@@ -369,11 +416,12 @@ for idxtg, tgFile in enumerate(textgridfiles):
                 hasNasal = True    
                 oriphonSilaba = phonSilaba
                 phonSilaba = phonSilaba.replace('͂','').replace('̃','')
-                print("Tratar as nasais")
+                if (VERBOSE):
+                    print("Tratar as nasais")
                 
             
             if (not has_vogal(tabFonologico)):
-                print("7: ID {:} com problema, {:} sem vogal.".format(tabId, tabFonologico))
+                rejects.add(7,idxL,interval,tabFonologico)
                 continue
             
             tabPrecedente = 'NA'
@@ -384,7 +432,7 @@ for idxtg, tgFile in enumerate(textgridfiles):
                 if (pos == -1):
                     pos, valT = find_pos_of_tag(grapSilaba,tags[0])
                 elif (pos == -1):
-                    print("13: Problema na detecçao da tag ID {:}".format(tabId))
+                    rejects.add(13,idxL,interval)
                     continue
                 if (pos == 0) and (len(phonSilaba) == vogLen):
                     tabPrecedente = 'NA'
@@ -399,13 +447,13 @@ for idxtg, tgFile in enumerate(textgridfiles):
                     tabPrecedente = phonSilaba[pos-1]
                     tabSeguinte = phonSilaba[pos+1]
             else:
-                if (hasNasal):
+                if (hasNasal) and (VERBOSE):
                     print('Depurando...')
-                pos = pos_indicated_vowel(phonSilaba, tags[0], tabId)
+                pos = pos_indicated_vowel(phonSilaba, tags[0], idxL)
                 if (pos == -1):
                     pos, valT = find_pos_of_tag(grapSilaba,tags[0])
                 elif (pos == -1):
-                    print("13: Problema na detecçao da tag ID {:}".format(tabId))
+                    rejects.add(13,idxL,interval)
                     continue
                 # pos = grapSilaba.find(tags[0])
                 if (pos == 0) and (len(phonSilaba) == 1):
@@ -433,7 +481,7 @@ for idxtg, tgFile in enumerate(textgridfiles):
                 if (pos == -1):
                     pos, valT = find_pos_of_tag(tabPalavra,tags[0])
                 elif (pos == -1):
-                    print("13: Problema na detecçao da tag ID {:}".format(tabId))
+                    rejects.add(13,idxL,interval)
                     continue
                 if (pos == 0) and (len(tabPalavra) == vogLen):
                     tabLetraPre = 'NA'
@@ -463,24 +511,162 @@ for idxtg, tgFile in enumerate(textgridfiles):
                     tabLetraSeg = tabPalavra[pos+1]
                     
             if (hasNasal):
-                print("recolocar a nasal")
+                if (VERBOSE):
+                    print("recolocar a nasal")
                 phonSilaba = oriphonSilaba
                 
             # TODO: Retirar redundancia de tabOral e hasNasal
             tabOral = int((not hasNasal))
             tabFechada = int((grapSilaba[-1] in listConsoante))
-            tabData = (tabId,tabDuration, tabF1,tabF2,tabF1_b,tabF2_b,tabIntensity,
+            tabData = (tabDuration, tabF1,tabF2,tabF1_b,tabF2_b,tabIntensity,
                        interval[2],vogalPos,
                        tabMeanHNR, tabFonetica,tabFonologico, tabDitongo, 
                        tabPalavra, tabTonicidade, tabPrecedente, tabSeguinte,tabFechada,
                        nSib, tabOral, tabLetraPre.lower(), tabLetraSeg.lower(),
                        tabSexo,tabFileName)
-            
-            strData = "{:}\n".format(tabData).replace("(","").replace(")","").replace(" ","").replace(",","\t")
             # sys.exit("Saida de depuraçao")
-            csvLines.append(strData)
-            tabId = tabId + 1
+            rows.append(tabData)
+            inst.count('accepted')
         # sys.exit("Saida de depuraçao - RODOU APENAS CAMADA 1!")
-        
-with open(CSVFILE, 'w') as file:
-        file.writelines(csvLines)
+    audioSeconds = audio.nSamples/sr
+    audio.close()
+    g2pService.flush()
+    stats = inst.stats()
+    if (stats is not None):
+        stats.update(file=Path(tgFile).name, seconds=time.perf_counter() - tFile,
+                     intervals=stats['counts'].get('intervals',0), audioSeconds=audioSeconds)
+    return FileResult(rows, maxNSyllab, g2pService.hits - g2pHits, g2pService.misses - g2pMisses, stats, rejects.records)
+# -----------------------------------------------------------------------------
+'''
+Importa os módulos adiados (scipy, chardet, unidecode) e carrega os recursos
+do g2p antes do primeiro arquivo, em cada processo. Sem isso o custo da
+importação entraria nas etapas medidas do primeiro arquivo (INSTRUMENT) e 
+distorceria o p95 e a lista dos arquivos mais lentos do relatório.
+'''
+def warm_up():
+    import scipy.signal, scipy.signal.windows, scipy.fft, scipy.integrate, scipy.io.wavfile
+    import chardet.universaldetector, unidecode
+    get_prefix_matcher()
+    get_homographs_heterophones()
+# -----------------------------------------------------------------------------
+'''
+Executa process_file para cada par (TextGrid, WAV). Com nWorkers > 1 cada par
+é uma tarefa de um pool de processos. Os resultados retornam sempre na ordem
+de textgridfiles, independente da ordem em que os processos terminam, e são 
+entregues um a um (gerador) assim que ficam prontos nessa ordem.
+Com um ResultCache (utils/results.py), os pares inalterados desde a última 
+execução são lidos da pasta de resultados e só os demais são processados; cada
+par concluído é gravado em seguida, então uma interrupção não perde o que já 
+foi feito.
+'''
+def run_files(textgridfiles, audiofiles, nWorkers=1, cache=None):
+    pairs = list(zip(textgridfiles, audiofiles))
+    stored = [None]*len(pairs)
+    if (cache is not None):
+        stored = [cache.get(tgFile, audioFile) for tgFile, audioFile in pairs]
+    todo = [k for k in range(len(pairs)) if stored[k] is None]
+    tgTodo = [pairs[k][0] for k in todo]
+    audioTodo = [pairs[k][1] for k in todo]
+    if (nWorkers > 1):
+        executor = ProcessPoolExecutor(max_workers=nWorkers, initializer=warm_up)
+        computed = executor.map(process_file, tgTodo, audioTodo)
+    else:
+        executor = None
+        if (len(todo) > 0):
+            warm_up()
+        computed = map(process_file, tgTodo, audioTodo)
+    try:
+        for k in range(len(pairs)):
+            if (stored[k] is not None):
+                yield FileResult(stored[k]['rows'], stored[k]['maxNSyllab'], 0, 0, None, stored[k]['rejections'])
+                continue
+            result = next(computed)
+            if (cache is not None):
+                cache.put(pairs[k][0], pairs[k][1], rows=result.rows, maxNSyllab=result.maxNSyllab,
+                          rejections=result.rejections)
+            yield result
+    finally:
+        if (executor is not None):
+            executor.shutdown()
+        if (cache is not None):
+            cache.save()
+# -----------------------------------------------------------------------------
+
+AUDIO_FOLDER = '../Audios/'
+CSVFILE = './csvDataAudios.csv'
+# Casas decimais dos números reais no CSV (None = todos os dígitos)
+FLOAT_PRECISION = None
+# Formato da tabela de saída: 'tsv' (CSVFILE) ou 'parquet' (CSVFILE com
+# extensão .parquet, requer pyarrow)
+OUTPUT_FORMAT = 'tsv'
+# Número de processos em paralelo (1 = sequencial)
+N_WORKERS = 1
+# Calcula formantes, intensidade e HNR uma única vez por arquivo e recorta por
+# intervalo. O HNR não é equivalente ao de get_hnr (ver utils/tracks.py)
+TRACK_MODE = False
+# Pasta dos resultados parciais por arquivo para reexecuções incrementais,
+# ex.: './resultados_parciais/' (None, o padrão, = sempre processa tudo)
+RESULTS_FOLDER = None
+# Mede o tempo de cada etapa e grava o relatório JSON em REPORT_FILE
+INSTRUMENT = False
+REPORT_FILE = './relatorio_tempos.json'
+# Arquivo com os intervalos descartados e o código do motivo
+REJECTIONS_FILE = './descartes.csv'
+# Imprime cada descarte e as mensagens de depuração na hora
+VERBOSE = False
+
+if __name__ == "__main__":
+    audiofiles = list_contend(folder=AUDIO_FOLDER, pattern=('.wav',))
+    textgridfiles = list_contend(folder=AUDIO_FOLDER, pattern=('.textgrid',))
+    
+    if (len(audiofiles) != len(textgridfiles)):
+        print("Erro: número de arquivos de áudio não corresponde ao numero de TextGrid")
+    if (TRACK_MODE):
+        print("Aviso: " + TRACK_HNR_NOTE)
+    
+    tabId = 0;
+    maxNSyllab = 0
+    g2pHits = 0
+    g2pMisses = 0
+    fileStats = []
+    rejectCounts = Counter()
+    tRun = time.perf_counter()
+    
+    cache = None
+    if (RESULTS_FOLDER):
+        # Qualquer mudança no código ou nos parâmetros invalida os resultados
+        codeFiles = [__file__] + glob.glob('utils/*.py') + glob.glob('g2p/*.py') + \
+                    glob.glob('g2p/resources/*.txt') + glob.glob('stress/*.py') + glob.glob('syllables/*.py')
+        cache = ResultCache(RESULTS_FOLDER, code_version(codeFiles, (valStep, valWin, useTiers, TRACK_MODE)))
+    
+    # O ID é atribuído após a junção dos resultados, estável para qualquer N_WORKERS.
+    # As linhas vão para o arquivo à medida que cada par termina.
+    if (OUTPUT_FORMAT == 'parquet'):
+        metadata = {'HNR': TRACK_HNR_NOTE} if (TRACK_MODE) else None
+        writer = ParquetWriter(str(Path(CSVFILE).with_suffix('.parquet')), strTitle, strTypes,
+                               metadata=metadata)
+    else:
+        writer = TsvWriter(CSVFILE, strTitle, precision=FLOAT_PRECISION)
+    with writer, TsvWriter(REJECTIONS_FILE, REJECTION_HEADER) as rejectWriter:
+        for result in run_files(textgridfiles, audiofiles, N_WORKERS, cache):
+            rejectWriter.writerows(result.rejections)
+            count_rejections(result.rejections, rejectCounts)
+            maxNSyllab = max(maxNSyllab, result.maxNSyllab)
+            g2pHits = g2pHits + result.g2pHits
+            g2pMisses = g2pMisses + result.g2pMisses
+            if (result.stats is not None):
+                fileStats.append(result.stats)
+            for tabRow in result.rows:
+                writer.writerow((tabId,) + tuple(tabRow))
+                tabId = tabId + 1
+    
+    print("Intervalos descartados (detalhes em {:}):".format(REJECTIONS_FILE))
+    print(rejection_summary(rejectCounts))
+    nG2P = max(1, g2pHits + g2pMisses)
+    print("Transcrições G2P: {:} acertos e {:} falhas no cache ({:2.1f}% de acerto).".format(g2pHits,g2pMisses,100*g2pHits/nG2P))
+    if (INSTRUMENT):
+        report = build_report(fileStats)
+        # Tempo total da execução; 'seconds' soma o tempo de cada arquivo nos processos
+        report['wallSeconds'] = time.perf_counter() - tRun
+        write_report(REPORT_FILE, report)
+        print("Relatório de tempos em {:} ({:} arquivos, {:2.1f} s de áudio por segundo).".format(REPORT_FILE,report['files'],report['audioSecondsPerSecond']))
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Comparação de syllables.ceci.CECISyllableSeparator (tabela de ações densa) com
+a classe original (CECISyllableSeparatorRef, letters.index a cada par de
+letras).
+
+Verifica que separate() e no_syllables() dão o mesmo resultado (ou o mesmo
+erro) nas duas versões e mede o tempo de cada uma e de separate_many() em uma
+lista de palavras. Sem arquivo indicado usa 100 mil palavras geradas a partir
+de sílabas do português.
+
+Uso (no diretório do repositório):
+    python -m benchmarks.bench_ceci [lista de palavras.txt]
+"""
+import sys
+import time
+import numpy as np
+from syllables.ceci import CECISyllableSeparator, CECISyllableSeparatorRef, separate_many
+
+N_WORDS = 100000
+ONSETS = ["", "b", "c", "d", "f", "g", "j", "l", "m", "n", "p", "r", "s", "t", "v", "ch",
+          "lh", "nh", "qu", "gu", "rr", "ss", "br", "cr", "pl", "tr", "pr", "gr", "fl", "x", "z", "ç"]
+NUCLEI = ["a", "e", "i", "o", "u", "á", "é", "í", "ó", "ú", "ã", "õ", "â", "ê", "ô", "ai", "ei",
+          "ou", "ão", "ui"]
+CODAS = ["", "", "", "", "s", "r", "l", "n", "m", "x"]
+# -----------------------------------------------------------------------------
+def make_words(n, seed=0):
+    rng = np.random.default_rng(seed)
+    words = []
+    for _ in range(n):
+        syl = [ONSETS[rng.integers(len(ONSETS))] + NUCLEI[rng.integers(len(NUCLEI))] +
+               CODAS[rng.integers(len(CODAS))] for _ in range(rng.integers(1, 6))]
+        words.append("".join(syl))
+    return words
+# -----------------------------------------------------------------------------
+def load_words(argv):
+    if (len(argv) > 1):
+        with open(argv[1], encoding='utf-8') as f:
+            return [w.strip().lower() for w in f if w.strip()]
+    return make_words(N_WORDS)
+# -----------------------------------------------------------------------------
+def separate(cls, word):
+    try:
+        return cls(word).separate(), cls(word).no_syllables(word)
+    except (ValueError, IndexError) as e:
+        return type(e).__name__
+# -----------------------------------------------------------------------------
+def timed(func, words):
+    tIni = time.perf_counter()
+    value = [func(w) for w in words]
+    return time.perf_counter() - tIni, value
+# -----------------------------------------------------------------------------
+if __name__ == "__main__":
+    words = load_words(sys.argv)
+    tRef, vRef = timed(lambda w: separate(CECISyllableSeparatorRef, w), words)
+    tNew, vNew = timed(lambda w: separate(CECISyllableSeparator, w), words)
+    tIni = time.perf_counter()
+    separate_many(words)
+    tMany = time.perf_counter() - tIni
+    nDiff = sum(a != b for a, b in zip(vRef, vNew))
+    print("{:} palavras ({:} distintas)".format(len(words), len(set(words))))
+    print("{:>36} {:>10}".format("Versão", "tempo (s)"))
+    print("{:>36} {:10.4f}".format("CECISyllableSeparatorRef", tRef))
+    print("{:>36} {:10.4f}".format("CECISyllableSeparator", tNew))
+    print("{:>36} {:10.4f}".format("separate_many (só separate)", tMany))
+    print("ganho {:.1f}x; {:} palavras diferentes".format(tRef/tNew, nDiff))
+    if (nDiff > 0):
+        sys.exit("Erro: CECISyllableSeparator difere de CECISyllableSeparatorRef.")
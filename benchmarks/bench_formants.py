@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Comparação de utils.formant_lpc.format_lpc com a implementação original
+quadro a quadro (format_lpc_ref, np.roots em cada quadro).
+
+Em vogais sintéticas (benchmarks.corpus) com F1 e F2 conhecidos mede o tempo
+das duas versões e o erro relativo mediano de F1 e F2 (média dos quadros entre
+20% e 80% da vogal, só os com formante, como em P00), com e sem o filtro de
+frequência mínima e largura de banda. Sem filtro, format_lpc deve reproduzir
+format_lpc_ref.
+
+Uso (no diretório do repositório):
+    python -m benchmarks.bench_formants [número de vogais]
+"""
+import sys
+import time
+import numpy as np
+from utils.formant_lpc import format_lpc, format_lpc_ref, mean_formant
+from .corpus import synth_vowel, VOWEL_FORMANTS
+
+sr = 16000
+valStep = 0.005
+valWin  = 0.020
+# -----------------------------------------------------------------------------
+def make_vowels(nVowels, seed=0):
+    rng = np.random.default_rng(seed)
+    names = list(VOWEL_FORMANTS)
+    vowels = []
+    for k in range(nVowels):
+        f1, f2 = VOWEL_FORMANTS[names[k % len(names)]]
+        f1, f2 = f1*(1 + 0.05*rng.standard_normal()), f2*(1 + 0.05*rng.standard_normal())
+        f0 = 200.0 if (k % 2 == 0) else 120.0
+        x = synth_vowel(f1, f2, 0.08 + 0.12*rng.random(), sr, rng, f0)
+        vowels.append((x + 1e-3*rng.standard_normal(len(x)), f1, f2))
+    return vowels
+# -----------------------------------------------------------------------------
+def run(func, vowels, **kwargs):
+    tIni = time.perf_counter()
+    F = [func(x, sr, winstep=valStep, winlen=valWin, **kwargs)[0] for x, _, _ in vowels]
+    seconds = time.perf_counter() - tIni
+    e1 = []
+    e2 = []
+    for f, (_, f1, f2) in zip(F, vowels):
+        e1.append(abs(mean_formant(f[0], 0.2, 0.8)/f1 - 1))
+        e2.append(abs(mean_formant(f[1], 0.2, 0.8)/f2 - 1))
+    return seconds, F, np.median(e1), np.median(e2)
+# -----------------------------------------------------------------------------
+if __name__ == "__main__":
+    nVowels = int(sys.argv[1]) if (len(sys.argv) > 1) else 200
+    vowels = make_vowels(nVowels)
+    tRef, FRef, e1Ref, e2Ref = run(format_lpc_ref, vowels)
+    tRaw, FRaw, e1Raw, e2Raw = run(format_lpc, vowels, minFreq=0, maxBandwidth=None)
+    tNew, _, e1New, e2New = run(format_lpc, vowels)
+    print("{:} vogais".format(nVowels))
+    print("{:>32} {:>10} {:>8} {:>8}".format("Versão","tempo (s)","erro F1","erro F2"))
+    print("{:>32} {:10.4f} {:8.1%} {:8.1%}".format("format_lpc_ref", tRef, e1Ref, e2Ref))
+    print("{:>32} {:10.4f} {:8.1%} {:8.1%}".format("format_lpc (sem filtro)", tRaw, e1Raw, e2Raw))
+    print("{:>32} {:10.4f} {:8.1%} {:8.1%}".format("format_lpc", tNew, e1New, e2New))
+    ok = all(np.allclose(a, b, rtol=1e-6, atol=1e-6) for a, b in zip(FRef, FRaw))
+    if not ok:
+        sys.exit("Erro: format_lpc sem filtro difere de format_lpc_ref.")
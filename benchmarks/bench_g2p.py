@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tempo de G2PTranscriber.transcriber por tamanho de palavra e verificação das
+transcrições contra um arquivo de referência (golden).
+
+As palavras são geradas a partir de sílabas do português (benchmarks.bench_ceci)
+e as palavras compostas longas juntam 6, 20 e 60 delas. As transcrições (silva
+e ceci) de todas as palavras são comparadas com o arquivo de referência
+(REFERENCE, gerado com as regras da versão original do repositório, antes das
+otimizações do g2p); sem o arquivo a execução termina com erro. Com --gravar o
+arquivo indicado é (re)escrito com as transcrições atuais, o que só deve ser
+feito quando uma mudança nas transcrições é intencional.
+
+Uso (no diretório do repositório):
+    python -m benchmarks.bench_g2p [referencia.tsv] [--gravar]
+"""
+import os
+import sys
+import time
+from g2p.g2p import G2PTranscriber
+from .bench_ceci import make_words
+
+# Transcrições de referência: algoritmo, palavra e transcrição (ou <Erro>)
+REFERENCE = os.path.join(os.path.dirname(__file__), 'resources', 'g2p_reference.tsv')
+N_WORDS = 30000
+COMPOUNDS = (1, 6, 20, 60)
+ALGORITHMS = ("silva", "ceci")
+# -----------------------------------------------------------------------------
+def transcribe(word, algorithm):
+    try:
+        return G2PTranscriber(word, algorithm=algorithm).transcriber()
+    except Exception as e:
+        return "<{:}>".format(type(e).__name__)
+# -----------------------------------------------------------------------------
+def time_compounds(words, repeat=5):
+    print("{:>10} {:>14} {:>16}".format("palavras", "letras (média)", "µs por palavra"))
+    for n in COMPOUNDS:
+        compounds = ["".join(words[k:k+n]) for k in range(0, min(len(words), 300*n), n)]
+        g2ps = [G2PTranscriber(w, algorithm="ceci") for w in compounds]
+        best = float('inf')
+        for _ in range(repeat):
+            tIni = time.perf_counter()
+            for g2p in g2ps:
+                try:
+                    g2p.transcriber()
+                except Exception:
+                    pass
+            best = min(best, time.perf_counter() - tIni)
+        print("{:>10} {:14.0f} {:16.1f}".format(n, sum(map(len, compounds))/len(compounds),
+                                               1e6*best/len(g2ps)))
+# -----------------------------------------------------------------------------
+def golden_rows(words):
+    compounds = ["".join(words[k:k+6]) for k in range(0, 6000, 6)]
+    return [(alg, w, transcribe(w, alg)) for alg in ALGORITHMS for w in words + compounds]
+# -----------------------------------------------------------------------------
+def write_golden(filename, words):
+    rows = golden_rows(words)
+    with open(filename, 'w', encoding='utf-8') as f:
+        f.writelines("\t".join(row) + "\n" for row in rows)
+    print("Referência com {:} transcrições gravada em {:}".format(len(rows), filename))
+# -----------------------------------------------------------------------------
+def check_golden(filename, words):
+    rows = golden_rows(words)
+    with open(filename, encoding='utf-8') as f:
+        golden = [tuple(line.rstrip("\n").split("\t")) for line in f]
+    # Referência truncada ou execução com menos linhas: zip pararia na menor
+    if (len(golden) != len(rows)):
+        print("Referência com {:} linhas, esperadas {:}".format(len(golden), len(rows)))
+        return False
+    diffs = [(a, b) for a, b in zip(golden, rows) if a != b]
+    print("{:} transcrições comparadas, {:} diferentes".format(len(rows), len(diffs)))
+    for a, b in diffs[:10]:
+        print("  {:} {:}: {:} -> {:}".format(a[0], a[1], a[2], b[2]))
+    return len(diffs) == 0
+# -----------------------------------------------------------------------------
+if __name__ == "__main__":
+    args = [a for a in sys.argv[1:] if a != '--gravar']
+    filename = args[0] if args else REFERENCE
+    words = make_words(N_WORDS, seed=3)
+    if ('--gravar' in sys.argv):
+        write_golden(filename, words)
+        sys.exit()
+    if not os.path.exists(filename):
+        sys.exit("Erro: arquivo de referência {:} não encontrado.".format(filename))
+    time_compounds(words)
+    if not check_golden(filename, words):
+        sys.exit("Erro: transcrições diferentes da referência.")
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Comparação de utils.hnr.get_hnr com get_HNR de Signal_Analysis.
+
+Gera um corpus sintético de trechos do tamanho de vogais (trem de pulsos
+amortecidos com F0 entre 80 e 300 Hz mais ruído, parte deles com metade em
+silêncio) em 16, 22.05 e 44.1 kHz, compara o HNR das duas implementações com
+os parâmetros usados em P00 e mede o tempo total de cada uma.
+
+Uso (no diretório do repositório):
+    python -m benchmarks.bench_hnr [número de trechos por taxa]
+"""
+import sys
+import time
+import warnings
+import numpy as np
+from Signal_Analysis.features.signal import get_HNR
+from utils.hnr import get_hnr
+
+valStep = 0.005
+warnings.filterwarnings("ignore")
+# -----------------------------------------------------------------------------
+def synthetic_segments(nSeg, sr, seed=0):
+    rng = np.random.default_rng(seed)
+    for k in range(nSeg):
+        nPts = int(rng.uniform(0.005,0.4)*sr)
+        t = np.arange(nPts)/sr
+        f0 = rng.uniform(80,300)
+        x = np.sign(np.sin(2*np.pi*f0*t))*np.exp(-5*((t*f0) % 1))
+        x = x + rng.uniform(0,1.5)*rng.standard_normal(nPts)
+        if (k % 10 == 0):
+            x[:nPts//2] = 0
+        yield x/np.max(np.abs(x))
+# -----------------------------------------------------------------------------
+if __name__ == "__main__":
+    nSeg = int(sys.argv[1]) if (len(sys.argv) > 1) else 100
+    nBad = 0
+    print("{:>8} {:>8} {:>12} {:>12} {:>10} {:>12}".format("sr","trechos","ref (s)","novo (s)","ganho","max |dif|"))
+    for sr in (16000, 22050, 44100):
+        tRef = tNew = maxDiff = 0.0
+        for x in synthetic_segments(nSeg, sr, seed=sr):
+            tIni = time.perf_counter()
+            ref = get_HNR(x,sr,time_step=valStep,periods_per_window=1.875)
+            tRef += time.perf_counter() - tIni
+            tIni = time.perf_counter()
+            new = get_hnr(x,sr,time_step=valStep,periods_per_window=1.875)
+            tNew += time.perf_counter() - tIni
+            if not np.isclose(ref, new.value, rtol=1e-9, atol=1e-9):
+                nBad = nBad + 1
+            maxDiff = max(maxDiff, abs(ref - new.value))
+        print("{:>8} {:>8} {:12.4f} {:12.4f} {:10.1f} {:12.2e}".format(sr,nSeg,tRef,tNew,tRef/tNew,maxDiff))
+    if (nBad > 0):
+        sys.exit("Erro: get_hnr difere de get_HNR em {:} trechos.".format(nBad))
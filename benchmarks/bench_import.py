@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tempo de importação dos módulos do pacote (python -X importtime) comparado com
+um orçamento por módulo.
+
+Cada módulo é importado em um processo novo, REPEAT vezes, e vale o menor
+tempo acumulado. Também verifica que a importação não carrega os módulos
+pesados (scipy.signal, scipy.fft, scipy.integrate, scipy.io, chardet,
+unidecode) nem lê os recursos do g2p (prefixos e homógrafos heterófonos), que
+só devem ser carregados no primeiro uso. Termina com erro se algum módulo
+passar do orçamento ou carregar algo antes da hora.
+
+Uso (no diretório do repositório):
+    python -m benchmarks.bench_import [fator do orçamento]
+"""
+import json
+import subprocess
+import sys
+
+# Orçamento (ms) do tempo acumulado de importação de cada módulo
+BUDGET = {
+    "g2p.g2p": 120,
+    "g2p.service": 150,
+    "utils.formant_lpc": 250,
+    "utils.file_utils": 300,
+    "utils.audio": 250,
+    "P00_Compute_Vogal_Features_v0": 600,
+}
+HEAVY = ("scipy.signal", "scipy.fft", "scipy.integrate", "scipy.io", "chardet", "unidecode")
+REPEAT = 5
+# Executado no processo filho: módulos pesados e recursos do g2p já carregados
+PROBE = """
+import sys, json
+import {:}
+loaded = [m for m in {:} if m in sys.modules]
+if "g2p.g2p" in sys.modules:
+    g2p = sys.modules["g2p.g2p"]
+    loaded += [name for name, get in g2p.LAZY_RESOURCES.items() if get.cache_info().currsize]
+print(json.dumps(loaded))
+"""
+# -----------------------------------------------------------------------------
+def import_time(module):
+    '''
+    Retorna o tempo acumulado (ms) de importação de module em um processo novo
+    e a lista do que foi carregado antes da hora.
+    '''
+    res = subprocess.run([sys.executable, "-X", "importtime", "-c", PROBE.format(module, HEAVY)],
+                         capture_output=True, text=True)
+    if (res.returncode != 0):
+        raise RuntimeError("Falha ao importar {:}:\n{:}".format(module, res.stderr))
+    us = None
+    for line in res.stderr.splitlines():
+        fields = line.split("|")
+        if (len(fields) == 3) and (fields[2].strip() == module):
+            us = int(fields[1])
+    return 1e-3*us, json.loads(res.stdout)
+# -----------------------------------------------------------------------------
+if __name__ == "__main__":
+    factor = float(sys.argv[1]) if (len(sys.argv) > 1) else 1.0
+    ok = True
+    print("{:>32} {:>10} {:>12}  {:}".format("Módulo", "tempo (ms)", "orçamento", "carregados"))
+    for module, budget in BUDGET.items():
+        runs = [import_time(module) for _ in range(REPEAT)]
+        ms = min(t for t, _ in runs)
+        loaded = runs[0][1]
+        ok = ok and (ms <= factor*budget) and not loaded
+        print("{:>32} {:10.1f} {:12.0f}  {:}".format(module, ms, factor*budget, ", ".join(loaded) or "-"))
+    if not ok:
+        sys.exit("Erro: importação acima do orçamento ou com carga antecipada.")
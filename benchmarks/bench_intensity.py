@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Comparação de utils.formant_lpc.intensity com a implementação original
+quadro a quadro (intensity_ref).
+
+Verifica a equivalência numérica dos contornos e mede o tempo das duas
+versões em trechos de 1 s, 10 s e no arquivo inteiro. Sem arquivo indicado
+usa um sinal sintético de 5 minutos.
+
+Uso (no diretório do repositório):
+    python -m benchmarks.bench_intensity [arquivo.wav]
+"""
+import sys
+import time
+import numpy as np
+from scipy.io import wavfile
+from utils.formant_lpc import intensity, intensity_ref
+
+valStep = 0.005
+valWin  = 0.020
+# -----------------------------------------------------------------------------
+def best_time(func, audio, sr, repeat=3):
+    best = np.inf
+    for _ in range(repeat):
+        tIni = time.perf_counter()
+        value = func(audio,sr,winstep=valStep,winlen=valWin)
+        best = min(best, time.perf_counter() - tIni)
+    return best, value
+# -----------------------------------------------------------------------------
+def load_audio(argv):
+    if (len(argv) > 1):
+        sr, audio = wavfile.read(argv[1])
+        if (len(audio.shape) > 1):
+            audio = np.mean(audio,axis = 1)
+        return sr, audio/np.max(np.abs(audio))
+    sr = 16000
+    rng = np.random.default_rng(0)
+    nPts = 300*sr
+    audio = rng.standard_normal(nPts)*np.abs(np.sin(2*np.pi*np.arange(nPts)/sr))
+    return sr, audio/np.max(np.abs(audio))
+# -----------------------------------------------------------------------------
+if __name__ == "__main__":
+    sr, audio = load_audio(sys.argv)
+    cases = (("1 s", audio[:sr]), ("10 s", audio[:10*sr]),
+             ("arquivo ({:.0f} s)".format(len(audio)/sr), audio))
+    ok = True
+    print("{:>20} {:>12} {:>12} {:>10} {:>12}".format("Entrada","ref (s)","novo (s)","ganho","max |dif|"))
+    for name, selAudio in cases:
+        tRef, iRef = best_time(intensity_ref, selAudio, sr, repeat=1)
+        tNew, iNew = best_time(intensity, selAudio, sr)
+        maxDiff = np.max(np.abs(iRef - iNew))
+        ok = ok and (iRef.shape == iNew.shape) and np.allclose(iRef, iNew, rtol=0, atol=1e-9)
+        print("{:>20} {:12.4f} {:12.4f} {:10.1f} {:12.2e}".format(name,tRef,tNew,tRef/tNew,maxDiff))
+    if not ok:
+        sys.exit("Erro: intensity difere de intensity_ref.")
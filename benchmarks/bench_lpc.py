@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Comparação de utils.lpc.levinson_batch (usada por lpc_batch e format_lpc)
+com lpc_ref (inversa explícita da matriz de Toeplitz) e levinson_1d.
+
+Para as ordens 8 a 24 verifica, em quadros de vogais sintéticas
+(benchmarks.corpus) com janela de Hamming, os coeficientes de predição contra
+lpc_ref e os coeficientes de reflexão e o erro de predição contra levinson_1d,
+e mede o tempo por quadro de lpc_ref e levinson_1d (um quadro por vez), da
+solução em lote com np.linalg.solve (versão anterior de lpc_batch) e de
+levinson_batch.
+
+Uso (no diretório do repositório):
+    python -m benchmarks.bench_lpc [número de quadros]
+"""
+import sys
+import time
+import numpy as np
+from utils.formant_lpc import frame_signal
+from utils.lpc import lpc_ref, levinson_1d, levinson_batch, autocorr_batch
+from .corpus import synth_vowel, VOWEL_FORMANTS
+
+ORDERS = (8, 12, 16, 20, 24)
+sr = 16000
+valStep = 0.005
+valWin  = 0.020
+# Quadros processados um por vez pelas versões de referência
+N_REF = 200
+# -----------------------------------------------------------------------------
+def make_frames(nFrames, seed=0):
+    rng = np.random.default_rng(seed)
+    nWin = int(valWin*sr)
+    nStep = int(valStep*sr)
+    dur = (nFrames*nStep + nWin)/sr/len(VOWEL_FORMANTS)
+    audio = np.concatenate([synth_vowel(f1, f2, dur, sr, rng) for f1, f2 in VOWEL_FORMANTS.values()])
+    audio = audio + 1e-4*rng.standard_normal(len(audio))
+    return frame_signal(audio, nWin, nStep)[:nFrames]*np.hamming(nWin)
+# -----------------------------------------------------------------------------
+def solve_batch(r, order):
+    lags = np.abs(np.subtract.outer(np.arange(order), np.arange(order)))
+    phi = np.linalg.solve(r[:, lags], -r[:, 1:, np.newaxis])[:, :, 0]
+    return np.concatenate((np.ones((r.shape[0], 1)), phi), axis=1)
+# -----------------------------------------------------------------------------
+def best_time(func, repeat=3):
+    best = np.inf
+    for _ in range(repeat):
+        tIni = time.perf_counter()
+        value = func()
+        best = min(best, time.perf_counter() - tIni)
+    return best, value
+# -----------------------------------------------------------------------------
+if __name__ == "__main__":
+    nFrames = int(sys.argv[1]) if (len(sys.argv) > 1) else 5000
+    frames = make_frames(nFrames)
+    nRef = min(N_REF, len(frames))
+    ok = True
+    print("{:} quadros de {:} amostras; tempos em microssegundos por quadro".format(*frames.shape))
+    print("{:>6} {:>10} {:>12} {:>10} {:>14} {:>10} {:>10} {:>10}".format(
+          "ordem","lpc_ref","levinson_1d","solve","levinson_batch","dif a","dif k","dif e"))
+    for order in ORDERS:
+        r = autocorr_batch(frames, order)
+        tRef, aRef = best_time(lambda: [lpc_ref(x, order) for x in frames[:nRef]], repeat=1)
+        t1d, lev1d = best_time(lambda: [levinson_1d(x.copy(), order) for x in r[:nRef]], repeat=1)
+        tSolve, _ = best_time(lambda: solve_batch(r, order))
+        tBatch, (a, e, k) = best_time(lambda: levinson_batch(r, order))
+        difA = np.max(np.abs(a[:nRef] - np.array(aRef)))
+        difK = np.max(np.abs(k[:nRef] - np.array([v[2] for v in lev1d])))
+        difE = np.max(np.abs(e[:nRef] - np.array([v[1] for v in lev1d]))/np.array([v[1] for v in lev1d]))
+        ok = ok and (difA < 1e-6) and (difK < 1e-9) and (difE < 1e-9)
+        print("{:6d} {:10.1f} {:12.1f} {:10.2f} {:14.2f} {:10.2e} {:10.2e} {:10.2e}".format(
+              order, 1e6*tRef/nRef, 1e6*t1d/nRef, 1e6*tSolve/len(frames), 1e6*tBatch/len(frames),
+              difA, difK, difE))
+    if not ok:
+        sys.exit("Erro: levinson_batch difere de lpc_ref/levinson_1d.")
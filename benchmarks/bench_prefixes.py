@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Comparação de g2p.utils.PrefixMatcher (trie, usada por pre_transcriber) com a
+busca sequencial original na lista de prefixos.
+
+Verifica que as duas buscas encontram o mesmo prefixo em palavras formadas
+pelos prefixos de g2p/resources/prefixes.txt e mede o tempo com a lista atual
+e com listas sintéticas de milhares de prefixos.
+
+Uso (no diretório do repositório):
+    python -m benchmarks.bench_prefixes
+"""
+import sys
+import time
+import numpy as np
+from g2p.g2p import PREFIXES, PREFIX_MATCHER, G2PTranscriber
+from g2p.utils import PrefixMatcher
+
+SIZES = (1000, 5000)
+SUFFIXES = ("-lo-gi-a", "-no-mi-a", "-má-ti-co", "-ção", "")
+# -----------------------------------------------------------------------------
+def sequential_match(prefixes, syllables):
+    for prefix, phones in prefixes:
+        if syllables.find(prefix) == 0:
+            return len(prefix), phones
+    return None
+# -----------------------------------------------------------------------------
+def synthetic_prefixes(n, seed=0):
+    # Sílabas CV aleatórias, 2 a 4 por prefixo. Os mais longos vêm primeiro,
+    # para que o primeiro encontrado na busca sequencial seja o mais longo
+    rng = np.random.default_rng(seed)
+    cons = "bcdfglmnprstv"
+    vows = "aeiou"
+    prefixes = {}
+    while (len(prefixes) < n):
+        syl = ["{:}{:}".format(cons[rng.integers(len(cons))], vows[rng.integers(len(vows))])
+               for _ in range(rng.integers(2, 5))]
+        prefixes.setdefault("-".join(syl), "-".join(syl))
+    return sorted(prefixes.items(), key=lambda p: -len(p[0]))
+# -----------------------------------------------------------------------------
+def best_time(func, words, repeat=3):
+    best = np.inf
+    for _ in range(repeat):
+        tIni = time.perf_counter()
+        value = [func(w) for w in words]
+        best = min(best, time.perf_counter() - tIni)
+    return best, value
+# -----------------------------------------------------------------------------
+if __name__ == "__main__":
+    words = [G2PTranscriber(p.replace("-", "") + s.replace("-", "")).syllables
+             for p, _ in PREFIXES for s in SUFFIXES]
+    words += ["ca-sa", "cho-co-la-te", "sa-pa-to"]*100
+    cases = [("prefixes.txt ({:})".format(len(PREFIXES)), PREFIXES, PREFIX_MATCHER, words)]
+    for n in SIZES:
+        prefixes = synthetic_prefixes(n)
+        synWords = [p + s for p, _ in prefixes[:500] for s in SUFFIXES] + words
+        cases.append(("sintéticos ({:})".format(n), prefixes, PrefixMatcher(prefixes), synWords))
+    ok = True
+    print("{:>24} {:>10} {:>14} {:>10} {:>10}".format("Prefixos","palavras","sequencial (s)","trie (s)","ganho"))
+    for name, prefixes, matcher, ws in cases:
+        tSeq, vSeq = best_time(lambda w: sequential_match(prefixes, w), ws, repeat=1)
+        tTrie, vTrie = best_time(matcher.match, ws)
+        ok = ok and (vSeq == vTrie)
+        print("{:>24} {:10d} {:14.4f} {:10.4f} {:10.1f}".format(name, len(ws), tSeq, tTrie, tSeq/tTrie))
+    if not ok:
+        sys.exit("Erro: PrefixMatcher difere da busca sequencial.")
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Execução incremental de P00 (run_files com utils.results.ResultCache) em um
+corpus sintético (benchmarks.corpus).
+
+Roda P00 duas vezes com a mesma pasta de resultados: na primeira todos os
+pares são processados e gravados, na segunda todos são lidos da pasta. Verifica
+que as linhas são as mesmas nas duas execuções e sem cache. O corpus inclui
+etiquetas com posição 0 (ex.: "a-casa-2-0-0"), em que a posição da sílaba é um
+escalar do numpy (estimate_syllabe_position).
+
+Uso (no diretório do repositório):
+    python -m benchmarks.bench_results [número de arquivos]
+"""
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+import P00_Compute_Vogal_Features_v0 as P00
+from g2p.service import TranscriptionService
+from utils.file_utils import list_contend
+from utils.results import ResultCache
+from .corpus import write_corpus, WORDS
+
+# Etiquetas com posição 0 além das do corpus padrão
+WORDS_POS0 = WORDS + [('a', 'casa', '2', '0', '0'), ('o', 'bolo', '2', '0', '0'),
+                      ('e', 'sapato', '3', '0', '0')]
+# Coluna da posição nas linhas de process_file (sem o ID)
+COL_POSITION = P00.strTitle.index('Posiçao') - 1
+# -----------------------------------------------------------------------------
+def run(textgrids, audiofiles, cache=None):
+    P00.g2pService = TranscriptionService(algorithm='ceci')
+    tIni = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        rows = [row for result in P00.run_files(textgrids, audiofiles, 1, cache)
+                for row in result.rows]
+    return time.perf_counter() - tIni, rows
+# -----------------------------------------------------------------------------
+if __name__ == "__main__":
+    nFiles = int(sys.argv[1]) if (len(sys.argv) > 1) else 4
+    with tempfile.TemporaryDirectory() as tmpDir:
+        corpus = os.path.join(tmpDir, 'corpus')
+        write_corpus(corpus, nFiles, words=WORDS_POS0)
+        textgrids = list_contend(folder=corpus, pattern=('.textgrid',))
+        audiofiles = list_contend(folder=corpus, pattern=('.wav',))
+        results = os.path.join(tmpDir, 'resultados')
+        tNone, rowsNone = run(textgrids, audiofiles)
+        tFirst, rowsFirst = run(textgrids, audiofiles, ResultCache(results, 'bench'))
+        tSecond, rowsSecond = run(textgrids, audiofiles, ResultCache(results, 'bench'))
+    nPos0 = sum(row[COL_POSITION] == 0 for row in rowsNone)
+    print("{:} arquivos, {:} linhas ({:} com posição 0)".format(nFiles, len(rowsNone), nPos0))
+    print("{:>28} {:>10}".format("Execução", "tempo (s)"))
+    print("{:>28} {:10.3f}".format("sem cache", tNone))
+    print("{:>28} {:10.3f}".format("cache vazio (grava)", tFirst))
+    print("{:>28} {:10.3f}".format("cache completo (lê)", tSecond))
+    if (nPos0 == 0):
+        sys.exit("Erro: nenhuma linha com posição 0 no corpus.")
+    if (rowsFirst != rowsNone) or (rowsSecond != rowsNone):
+        sys.exit("Erro: linhas lidas do cache diferem das calculadas.")
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Comparação de utils.file_utils.spectral_ratios com a implementação original
+quadro a quadro (spectral_ratios_ref).
+
+Verifica a equivalência de COG_1, COG_2, COG_2/3 e LTF e mede o tempo das
+duas versões em trechos de 1 s, 10 s e no arquivo inteiro. Sem arquivo
+indicado usa um sinal sintético de 5 minutos.
+
+Uso (no diretório do repositório):
+    python -m benchmarks.bench_spectral [arquivo.wav]
+"""
+import sys
+import time
+import numpy as np
+from utils.file_utils import spectral_ratios, spectral_ratios_ref
+from .bench_intensity import load_audio
+
+valStep = 0.005
+# -----------------------------------------------------------------------------
+def best_time(func, audio, sr, repeat=3):
+    best = np.inf
+    for _ in range(repeat):
+        tIni = time.perf_counter()
+        value = func(audio,sr,valStep)
+        best = min(best, time.perf_counter() - tIni)
+    return best, value
+# -----------------------------------------------------------------------------
+if __name__ == "__main__":
+    sr, audio = load_audio(sys.argv)
+    cases = (("1 s", audio[:sr]), ("10 s", audio[:10*sr]),
+             ("arquivo ({:.0f} s)".format(len(audio)/sr), audio))
+    ok = True
+    print("{:>20} {:>12} {:>12} {:>10} {:>12}".format("Entrada","ref (s)","novo (s)","ganho","max dif rel"))
+    for name, selAudio in cases:
+        tRef, vRef = best_time(spectral_ratios_ref, selAudio, sr, repeat=1)
+        tNew, vNew = best_time(spectral_ratios, selAudio, sr)
+        maxDiff = 0.0
+        for ref, new in zip(vRef, vNew):
+            ref = np.asarray(ref)
+            ok = ok and (ref.shape == new.shape) and np.allclose(ref, new, rtol=1e-9, atol=1e-12)
+            if (len(ref) > 0):
+                maxDiff = max(maxDiff, np.max(np.abs(ref - new)/np.maximum(np.abs(ref),1e-300)))
+        print("{:>20} {:12.4f} {:12.4f} {:10.1f} {:12.2e}".format(name,tRef,tNew,tRef/tNew,maxDiff))
+    if not ok:
+        sys.exit("Erro: spectral_ratios difere de spectral_ratios_ref.")
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark do processamento completo em corpora sintéticos (benchmarks.corpus).
+
+Para cada tamanho de corpus em SIZES (número de pares WAV + TextGrid) mede o
+tempo de format_lpc, intensity e spectral_ratios em cada vogal, de
+textgrid_to_interval_matrix em cada TextGrid, de G2PTranscriber.transcriber
+em cada palavra (sem cache) e de P00 inteiro (run_files). Também compara os
+F1 e F2 da tabela de P00 com os valores usados na síntese.
+
+O resultado é gravado em JSON para comparar execuções; com um JSON anterior
+são impressas as razões de tempo (anterior/atual) por etapa.
+
+Uso (no diretório do repositório):
+    python -m benchmarks.bench_suite [saida.json] [anterior.json]
+"""
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import numpy as np
+from scipy.io import wavfile
+from utils.file_utils import textgrid_to_interval_matrix, spectral_ratios
+from utils.formant_lpc import format_lpc, intensity
+from g2p.g2p import G2PTranscriber
+from g2p.service import TranscriptionService
+from .corpus import write_corpus
+
+# Número de pares (WAV, TextGrid) de cada corpus e de vogais por arquivo
+SIZES = (2, 8, 32)
+N_VOWELS = 20
+valStep = 0.005
+valWin  = 0.020
+# -----------------------------------------------------------------------------
+class Stages(object):
+    def __init__(self):
+        self.stages = {}
+
+    @contextlib.contextmanager
+    def time(self, name, calls=1):
+        tIni = time.perf_counter()
+        yield
+        stage = self.stages.setdefault(name, {'seconds': 0.0, 'calls': 0})
+        stage['seconds'] += time.perf_counter() - tIni
+        stage['calls'] += calls
+# -----------------------------------------------------------------------------
+def load_segments(folder, truth):
+    audios = {}
+    segments = []
+    for t in truth:
+        if t['file'] not in audios:
+            sr, audio = wavfile.read(os.path.join(folder, t['file'] + '.wav'))
+            audios[t['file']] = (sr, audio/np.max(np.abs(audio)))
+        sr, audio = audios[t['file']]
+        segments.append(audio[int(t['xmin']*sr):int(t['xmax']*sr)])
+    return sr, segments, sum(len(a)/sr for sr, a in audios.values())
+# -----------------------------------------------------------------------------
+def formant_accuracy(rows, truth):
+    '''
+    Erro relativo de F1 e F2 das linhas de P00, associadas às vogais
+    sintetizadas pelo arquivo, etiqueta e duração.
+    '''
+    byKey = {(t['file'], t['label'], round(t['xmax'] - t['xmin'], 9)): t for t in truth}
+    e1 = []
+    e2 = []
+    for row in rows:
+        t = byKey.get((row[-1], row[6], round(row[0], 9)))
+        if (t is not None):
+            e1.append(abs(row[1]/t['F1'] - 1))
+            e2.append(abs(row[2]/t['F2'] - 1))
+    if (len(e1) == 0):
+        return {'matched': 0}
+    return {'matched': len(e1),
+            'F1': {'medianRelError': float(np.median(e1)), 'within10pct': float(np.mean(np.array(e1) < 0.1))},
+            'F2': {'medianRelError': float(np.median(e2)), 'within10pct': float(np.mean(np.array(e2) < 0.1))}}
+# -----------------------------------------------------------------------------
+def run_size(P00, nFiles):
+    with tempfile.TemporaryDirectory() as folder:
+        truth = write_corpus(folder, nFiles, N_VOWELS)
+        sr, segments, audioSeconds = load_segments(folder, truth)
+        textgrids = P00.list_contend(folder, ('.textgrid',))
+        audiofiles = P00.list_contend(folder, ('.wav',))
+        words = [t['label'].split('-')[1] for t in truth]
+        st = Stages()
+        with st.time('format_lpc', len(segments)):
+            for x in segments:
+                format_lpc(x, sr, winstep=valStep, winlen=valWin)
+        with st.time('intensity', len(segments)):
+            for x in segments:
+                intensity(x, sr, winstep=valStep, winlen=valWin)
+        with st.time('spectral_ratios', len(segments)):
+            for x in segments:
+                spectral_ratios(x, sr, valStep)
+        with st.time('textgrid_to_interval_matrix', len(textgrids)):
+            for tgFile in textgrids:
+                textgrid_to_interval_matrix(tgFile)
+        with st.time('G2PTranscriber.transcriber', len(words)):
+            for word in words:
+                G2PTranscriber(word, algorithm='ceci').transcriber()
+        # P00 com um serviço G2P novo, sem léxico em disco
+        P00.g2pService = TranscriptionService(algorithm='ceci')
+        with contextlib.redirect_stdout(io.StringIO()):
+            with st.time('P00.run_files', len(textgrids)):
+                results = list(P00.run_files(textgrids, audiofiles, 1))
+        rows = [row for result in results for row in result.rows]
+    total = st.stages['P00.run_files']['seconds']
+    return {'files': nFiles, 'vowels': len(truth), 'audioSeconds': audioSeconds,
+            'rows': len(rows), 'stages': st.stages,
+            'pipelineAudioSecondsPerSecond': audioSeconds/total,
+            'accuracy': formant_accuracy(rows, truth)}
+# -----------------------------------------------------------------------------
+def metadata():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                                text=True).stdout.strip()
+    except OSError:
+        commit = ''
+    return {'date': time.strftime('%Y-%m-%d %H:%M:%S'), 'commit': commit,
+            'python': platform.python_version(), 'numpy': np.__version__,
+            'machine': platform.machine(), 'cpus': os.cpu_count()}
+# -----------------------------------------------------------------------------
+def compare(old, new):
+    print("\nComparação com {:} ({:}):".format(old['meta'].get('commit', ''), old['meta'].get('date', '')))
+    print("{:>8} {:>30} {:>12} {:>12} {:>8}".format("arquivos","etapa","anterior (s)","atual (s)","razão"))
+    for size, result in new['sizes'].items():
+        previous = old['sizes'].get(size)
+        if (previous is None):
+            continue
+        for name, stage in result['stages'].items():
+            if name in previous['stages']:
+                tOld = previous['stages'][name]['seconds']
+                print("{:>8} {:>30} {:12.4f} {:12.4f} {:8.2f}".format(size, name, tOld, stage['seconds'],
+                                                                   tOld/max(stage['seconds'], 1e-12)))
+# -----------------------------------------------------------------------------
+if __name__ == "__main__":
+    outFile = sys.argv[1] if (len(sys.argv) > 1) else 'bench_suite.json'
+    import P00_Compute_Vogal_Features_v0 as P00
+    report = {'meta': metadata(), 'nVowels': N_VOWELS, 'sizes': {}}
+    print("{:>8} {:>30} {:>12} {:>12}".format("arquivos","etapa","total (s)","por chamada"))
+    for nFiles in SIZES:
+        result = run_size(P00, nFiles)
+        report['sizes'][str(nFiles)] = result
+        for name, stage in result['stages'].items():
+            print("{:>8} {:>30} {:12.4f} {:12.6f}".format(nFiles, name, stage['seconds'], stage['seconds']/stage['calls']))
+        acc = result['accuracy']
+        if (acc['matched'] > 0):
+            print("{:>8} {:>30} F1 {:.1%} e F2 {:.1%} (erro relativo mediano, {:} vogais)".format(
+                nFiles, "precisão", acc['F1']['medianRelError'], acc['F2']['medianRelError'], acc['matched']))
+    with open(outFile, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print("Resultados gravados em {:}".format(outFile))
+    if (len(sys.argv) > 2):
+        with open(sys.argv[2], encoding='utf-8') as f:
+            compare(json.load(f), report)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Comparação da leitura em fluxo de TextGrid (textgrid_to_interval_matrix, 
+baseada em utils.textgrid) com a implementação original por readlines()
+(textgrid_to_interval_matrix_ref).
+
+Gera um TextGrid grande com várias camadas, verifica que as duas versões
+retornam as mesmas matrizes e mede tempo e pico de memória, lendo todas as
+camadas e apenas a primeira. Também verifica que arquivos vazios, truncados ou
+binários são apenas relatados como erro de leitura, sem exceção.
+
+Uso (no diretório do repositório):
+    python -m benchmarks.bench_textgrid [número de intervalos por camada]
+"""
+import contextlib
+import io
+import os
+import sys
+import time
+import tempfile
+import tracemalloc
+from utils.file_utils import textgrid_to_interval_matrix, textgrid_to_interval_matrix_ref
+
+N_TIERS = 5
+# -----------------------------------------------------------------------------
+def write_textgrid(filename, nTiers, nIntervals, step=0.05):
+    xmax = nIntervals*step
+    with open(filename, 'w', encoding='utf-8') as file:
+        file.write('File type = "ooTextFile"\nObject class = "TextGrid"\n\n')
+        file.write('xmin = 0 \nxmax = {:} \ntiers? <exists> \nsize = {:} \nitem []: \n'.format(xmax,nTiers))
+        for t in range(nTiers):
+            file.write('    item [{:}]:\n'.format(t+1))
+            file.write('        class = "IntervalTier" \n        name = "camada_{:}_ção" \n'.format(t))
+            file.write('        xmin = 0 \n        xmax = {:} \n'.format(xmax))
+            file.write('        intervals: size = {:} \n'.format(nIntervals))
+            for i in range(nIntervals):
+                label = "a-casa-2-0-1" if (i % 2) else ""
+                file.write('        intervals [{:}]:\n'.format(i+1))
+                file.write('            xmin = {:} \n            xmax = {:} \n'.format(i*step,(i+1)*step))
+                file.write('            text = "{:}" \n'.format(label))
+# -----------------------------------------------------------------------------
+def measure(func, filename, **kwargs):
+    tracemalloc.start()
+    tIni = time.perf_counter()
+    value = func(filename, **kwargs)
+    tRun = time.perf_counter() - tIni
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return tRun, peak/2**20, value
+# -----------------------------------------------------------------------------
+def check_truncated(filename):
+    '''
+    Lê o início de um TextGrid pequeno cortado em vários pontos, e um arquivo
+    binário; retorna a lista dos cortes que geraram exceção.
+    '''
+    write_textgrid(filename, 2, 20)
+    with open(filename, 'rb') as file:
+        content = file.read()
+    cuts = [0, 10, 60, len(content)//3, len(content)-40]
+    failed = []
+    for data in [content[:n] for n in cuts] + [bytes(range(256))*4]:
+        with open(filename, 'wb') as file:
+            file.write(data)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                textgrid_to_interval_matrix(filename)
+        except Exception as e:
+            failed.append((len(data), repr(e)))
+    return failed
+# -----------------------------------------------------------------------------
+if __name__ == "__main__":
+    nIntervals = int(sys.argv[1]) if (len(sys.argv) > 1) else 100000
+    with tempfile.TemporaryDirectory() as tmpDir:
+        filename = os.path.join(tmpDir, 'grande.TextGrid')
+        write_textgrid(filename, N_TIERS, nIntervals)
+        print("Arquivo: {:} camadas x {:} intervalos ({:.1f} MB)".format(N_TIERS,nIntervals,os.path.getsize(filename)/2**20))
+        tRef, mRef, vRef = measure(textgrid_to_interval_matrix_ref, filename)
+        tNew, mNew, vNew = measure(textgrid_to_interval_matrix, filename)
+        tOne, mOne, vOne = measure(textgrid_to_interval_matrix, filename, tiers=(0,))
+        failed = check_truncated(os.path.join(tmpDir, 'truncado.TextGrid'))
+    print("{:>28} {:>10} {:>14}".format("Versão","tempo (s)","pico (MB)"))
+    print("{:>28} {:10.3f} {:14.1f}".format("readlines (ref)",tRef,mRef))
+    print("{:>28} {:10.3f} {:14.1f}".format("fluxo, todas as camadas",tNew,mNew))
+    print("{:>28} {:10.3f} {:14.1f}".format("fluxo, camada 0",tOne,mOne))
+    if (vRef != vNew) or (vOne[0] != vRef[0]):
+        sys.exit("Erro: leitura em fluxo difere da implementação original.")
+    if failed:
+        sys.exit("Erro: exceção ao ler arquivo truncado: {:}".format(failed))
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gerador de corpus sintético (WAV + TextGrid) para os benchmarks.
+
+Cada arquivo tem nVowels vogais separadas por pausas com ruído baixo. Cada
+vogal é um trem de pulsos glotais de Rosenberg (F0 com leve variação)
+filtrado por uma cascata de ressonadores com F1 e F2 conhecidos (mais F3 e F4
+fixos). O TextGrid tem uma camada de intervalos com as etiquetas no formato de
+P00, vogal-palavra-nsilabas-tonicidade-posicao (ex.: "a-casa-2-0-1").
+
+Os nomes seguem o padrão esperado por P00 (o sexo na posição -15 do nome do
+TextGrid) e a verdade de cada vogal (F1 e F2 usados na síntese) é gravada em
+truth.json.
+
+Uso (no diretório do repositório):
+    python -m benchmarks.corpus pasta [número de arquivos] [vogais por arquivo]
+"""
+import json
+import os
+import sys
+import numpy as np
+from scipy.io import wavfile
+from scipy.signal import lfilter
+
+# F1 e F2 médios (Hz) das vogais orais sintetizadas
+VOWEL_FORMANTS = {'a': (700, 1250), 'e': (420, 1950), 'i': (300, 2250),
+                  'o': (430, 850), 'u': (330, 780)}
+# (vogal, palavra, sílabas, tonicidade, posição)
+WORDS = [('a', 'casa', '2', '0', '1'), ('o', 'bolo', '2', '0', '1'),
+         ('e', 'sapato', '3', '0', '2'), ('i', 'vida', '2', '0', '1'),
+         ('u', 'luz', '1', '0', '1'), ('a', 'chocolate', '4', '0', '2'),
+         ('e', 'mesa', '2', '0', '1'), ('u', 'tudo', '2', '0', '1')]
+# Formantes superiores e larguras de banda (Hz) de F1..F4
+HIGH_FORMANTS = (2600, 3400)
+BANDWIDTHS = (60, 90, 120, 150)
+# -----------------------------------------------------------------------------
+def rosenberg_pulse(nPeriod, openQ=0.4, closeQ=0.16):
+    nOpen = max(1, int(openQ*nPeriod))
+    nClose = max(1, int(closeQ*nPeriod))
+    g = np.zeros((nPeriod,))
+    g[:nOpen] = 0.5*(1 - np.cos(np.pi*np.arange(nOpen)/nOpen))
+    nClose = min(nClose, nPeriod - nOpen)
+    g[nOpen:nOpen+nClose] = np.cos(0.5*np.pi*np.arange(nClose)/nClose)
+    return g
+# -----------------------------------------------------------------------------
+def synth_vowel(f1, f2, dur, sr, rng, f0=120.0):
+    nPts = int(dur*sr)
+    pulses = []
+    n = 0
+    while (n < nPts):
+        nPeriod = int(sr/(f0*(1 + 0.02*rng.standard_normal())))
+        pulses.append(rosenberg_pulse(nPeriod))
+        n = n + nPeriod
+    # Derivada do pulso glotal (radiação nos lábios)
+    x = np.diff(np.concatenate(pulses), prepend=0)[:nPts]
+    for f, b in zip((f1, f2) + HIGH_FORMANTS, BANDWIDTHS):
+        r = np.exp(-np.pi*b/sr)
+        x = lfilter([1 - r], [1, -2*r*np.cos(2*np.pi*f/sr), r*r], x)
+    # Rampa de 10 ms nas bordas
+    nRamp = min(nPts//2, int(0.01*sr))
+    ramp = np.linspace(0, 1, nRamp)
+    x[:nRamp] *= ramp
+    x[nPts-nRamp:] *= ramp[::-1]
+    return x/np.max(np.abs(x))
+# -----------------------------------------------------------------------------
+def write_textgrid(filename, xmax, intervals, tierName="vogal_ção"):
+    '''
+    Grava um TextGrid (formato longo) com uma camada de intervalos
+    [(xmin, xmax, texto), ...] que cobre [0, xmax]. O nome da camada tem
+    acentos de propósito, como nos arquivos reais em UTF-8.
+    '''
+    lines = ['File type = "ooTextFile"', 'Object class = "TextGrid"', '',
+             'xmin = 0 ', 'xmax = {:} '.format(xmax), 'tiers? <exists> ', 'size = 1 ', 'item []: ',
+             '    item [1]:', '        class = "IntervalTier" ', '        name = "{:}" '.format(tierName),
+             '        xmin = 0 ', '        xmax = {:} '.format(xmax),
+             '        intervals: size = {:} '.format(len(intervals))]
+    for k, (a, b, text) in enumerate(intervals):
+        lines += ['        intervals [{:}]:'.format(k+1), '            xmin = {:} '.format(a),
+                  '            xmax = {:} '.format(b), '            text = "{:}" '.format(text)]
+    with open(filename, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines) + '\n')
+# -----------------------------------------------------------------------------
+def write_corpus(folder, nFiles, nVowels=20, sr=16000, seed=0, words=WORDS):
+    '''
+    Gera nFiles pares (WAV, TextGrid) em folder e retorna a lista com a
+    verdade de cada vogal: arquivo, índice entre os intervalos etiquetados,
+    início, fim, etiqueta, F1 e F2. As etiquetas são sorteadas de words.
+    '''
+    os.makedirs(folder, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    truth = []
+    for k in range(nFiles):
+        name = "spk{:03d}_{:}_0001".format(k, "FM"[k % 2])
+        f0 = 200.0 if (k % 2 == 0) else 120.0
+        segments = []
+        intervals = []
+        t = 0.0
+        for m in range(nVowels):
+            gap = 0.1 + 0.1*rng.random()
+            segments.append(0.001*rng.standard_normal(int(gap*sr)))
+            intervals.append((t, t + len(segments[-1])/sr, ""))
+            t = intervals[-1][1]
+            word = words[rng.integers(len(words))]
+            f1, f2 = VOWEL_FORMANTS[word[0]]
+            f1, f2 = f1*(1 + 0.05*rng.standard_normal()), f2*(1 + 0.05*rng.standard_normal())
+            segments.append(synth_vowel(f1, f2, 0.08 + 0.12*rng.random(), sr, rng, f0))
+            label = "-".join(word)
+            intervals.append((t, t + len(segments[-1])/sr, label))
+            truth.append({'file': name, 'index': m, 'xmin': t, 'xmax': intervals[-1][1],
+                          'label': label, 'F1': f1, 'F2': f2})
+            t = intervals[-1][1]
+        segments.append(0.001*rng.standard_normal(int(0.1*sr)))
+        intervals.append((t, t + len(segments[-1])/sr, ""))
+        audio = np.concatenate(segments)
+        audio = (0.8*audio/np.max(np.abs(audio))*32767).astype(np.int16)
+        wavfile.write(os.path.join(folder, name + ".wav"), sr, audio)
+        write_textgrid(os.path.join(folder, name + ".TextGrid"), len(audio)/sr, intervals)
+    with open(os.path.join(folder, "truth.json"), 'w', encoding='utf-8') as f:
+        json.dump(truth, f, ensure_ascii=False, indent=1)
+    return truth
+# -----------------------------------------------------------------------------
+if __name__ == "__main__":
+    if (len(sys.argv) < 2):
+        sys.exit(__doc__)
+    nFiles = int(sys.argv[2]) if (len(sys.argv) > 2) else 4
+    nVowels = int(sys.argv[3]) if (len(sys.argv) > 3) else 20
+    truth = write_corpus(sys.argv[1], nFiles, nVowels)
+    print("{:} arquivos e {:} vogais gravados em {:}".format(nFiles, len(truth), sys.argv[1]))
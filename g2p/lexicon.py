@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+# -*- encoding:utf-8 -*-
+
+# lexicon.py - Persistent on-disk lexicon of G2P results shared across runs
+# and worker processes.
+
+from __future__ import unicode_literals
+
+import hashlib
+import os
+import sqlite3
+
+PATH_RESOURCES = os.path.dirname(__file__) + "/resources"
+
+PATH_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Files whose content defines the transcription: resources and rule code
+RULE_FILES = [
+    PATH_RESOURCES + "/prefixes.txt",
+    PATH_RESOURCES + "/homographs_heterophones.txt",
+    os.path.dirname(__file__) + "/g2p.py",
+    os.path.dirname(__file__) + "/utils.py",
+    PATH_ROOT + "/stress/tonic.py",
+    PATH_ROOT + "/syllables/ceci.py",
+    PATH_ROOT + "/syllables/silva2011.py",
+    PATH_ROOT + "/syllables/cases.py",
+]
+
+
+def rules_fingerprint(paths=RULE_FILES):
+    """
+    Returns a hash of the G2P resources and rule code.
+
+    Args:
+        paths: Files to hash
+
+    Returns: Hexadecimal SHA-1 digest, e.g. "3f2a...c1"
+
+    """
+    digest = hashlib.sha1()
+    for path in paths:
+        with open(path, "rb") as f:
+            digest.update(hashlib.sha1(f.read()).digest())
+    return digest.hexdigest()
+
+
+class Lexicon(object):
+    """
+    SQLite key/value store of (syllables, stress boundaries, phonemes) keyed
+    on (word, algorithm). Entries written under a different rules
+    fingerprint are discarded when the lexicon is opened, so changes to the
+    rules or resources invalidate it automatically.
+
+    The connection is opened on first use and reopened in forked processes,
+    so one Lexicon object can be created before a process pool starts.
+
+    """
+
+    def __init__(self, path, fingerprint=None, flush_every=256):
+        self.path = path
+        self.fingerprint = fingerprint or rules_fingerprint()
+        self.flush_every = flush_every
+        self._conn = None
+        self._pid = None
+        self._pending = []
+
+    def _connect(self):
+        if self._conn is not None and self._pid == os.getpid():
+            return self._conn
+        self._conn = sqlite3.connect(self.path, timeout=60)
+        self._pid = os.getpid()
+        self._pending = []
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS lexicon ("
+                "word TEXT, algorithm TEXT, fingerprint TEXT, "
+                "syllables TEXT, stress_boundaries TEXT, phonemes TEXT, "
+                "PRIMARY KEY (word, algorithm, fingerprint))"
+            )
+            self._conn.execute(
+                "DELETE FROM lexicon WHERE fingerprint != ?", (self.fingerprint,)
+            )
+        return self._conn
+
+    def get(self, word, algorithm):
+        """
+        Returns the stored (syllables, stress_boundaries, phonemes) of a word
+        or None if it is not in the lexicon.
+
+        """
+        row = (
+            self._connect()
+            .execute(
+                "SELECT syllables, stress_boundaries, phonemes FROM lexicon "
+                "WHERE word = ? AND algorithm = ? AND fingerprint = ?",
+                (word, algorithm, self.fingerprint),
+            )
+            .fetchone()
+        )
+        return row
+
+    def put(self, word, algorithm, entry):
+        """
+        Stores the (syllables, stress_boundaries, phonemes) of a word. Writes
+        are buffered and committed every flush_every entries.
+
+        """
+        self._connect()
+        self._pending.append((word, algorithm, self.fingerprint) + tuple(entry))
+        if len(self._pending) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        if self._conn is None or self._pid != os.getpid() or not self._pending:
+            return
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO lexicon VALUES (?, ?, ?, ?, ?, ?)",
+                self._pending,
+            )
+        self._pending = []
+
+    def close(self):
+        self.flush()
+        if self._conn is not None and self._pid == os.getpid():
+            self._conn.close()
+        self._conn = None
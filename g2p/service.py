@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- encoding:utf-8 -*-
+
+# service.py - Memoized transcription service around G2PTranscriber.
+
+from __future__ import unicode_literals
+
+from collections import OrderedDict, namedtuple
+
+from .g2p import G2PTranscriber
+
+# Result of a transcription, e.g.
+# Transcription("cho-co-la-te", "cho-co-[la]-te", "ʃo.ko.ˈla.ʧɪ")
+Transcription = namedtuple(
+    "Transcription", ["syllables", "stress_boundaries", "phonemes"]
+)
+
+
+class TranscriptionService(object):
+    """
+    Bounded LRU cache of G2PTranscriber results keyed on the normalized word
+    and the syllabification algorithm, optionally backed by an on-disk
+    Lexicon shared across runs and worker processes.
+
+    """
+
+    def __init__(self, algorithm="silva", maxsize=4096, lexicon=None):
+        self.algorithm = algorithm
+        self.maxsize = maxsize
+        self.lexicon = lexicon
+        self.hits = 0
+        self.misses = 0
+        self.lexicon_hits = 0
+        self._cache = OrderedDict()
+
+    @staticmethod
+    def normalize(word):
+        """
+        Returns the cache key form of a word, e.g. " Casa " -> "casa"
+
+        """
+        return word.strip().lower()
+
+    def _compute(self, word, algorithm):
+        if self.lexicon is not None:
+            entry = self.lexicon.get(word, algorithm)
+            if entry is not None:
+                self.lexicon_hits += 1
+                return Transcription(*entry)
+
+        g2p = G2PTranscriber(word, algorithm=algorithm)
+        result = Transcription(
+            g2p.syllables,
+            g2p.get_syllables_with_stress_boundaries(),
+            g2p.transcriber(),
+        )
+        if self.lexicon is not None:
+            self.lexicon.put(word, algorithm, result)
+        return result
+
+    def flush(self):
+        """
+        Commits pending lexicon writes, if the service has a lexicon.
+
+        """
+        if self.lexicon is not None:
+            self.lexicon.flush()
+
+    def transcribe(self, word, algorithm=None):
+        """
+        Transcribe a word, reusing a previous result when available.
+
+        Args:
+            word: Input word, e.g. "chocolate"
+            algorithm: Syllabification algorithm, defaults to the service one
+
+        Returns: Transcription of the word
+
+        """
+        key = (self.normalize(word), algorithm or self.algorithm)
+        result = self._cache.get(key)
+        if result is not None:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return result
+
+        self.misses += 1
+        result = self._compute(*key)
+        self._cache[key] = result
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+        return result
+
+    def transcribe_many(self, words, algorithm=None):
+        """
+        Transcribe a list of words, computing each distinct word only once.
+
+        Args:
+            words: Input words, e.g. ["casa", "Casa", "bolo"]
+            algorithm: Syllabification algorithm, defaults to the service one
+
+        Returns: List of Transcription, in the order of words
+
+        """
+        unique = OrderedDict.fromkeys(self.normalize(w) for w in words)
+        results = {w: self.transcribe(w, algorithm) for w in unique}
+        return [results[self.normalize(w)] for w in words]
+
+    def cache_info(self):
+        """
+        Returns cache counters, e.g. {"hits": 90, "misses": 10, ...}. Misses
+        answered by the on-disk lexicon are counted in lexicon_hits.
+
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "lexicon_hits": self.lexicon_hits,
+            "size": len(self._cache),
+            "maxsize": self.maxsize,
+        }
@@ -65,3 +65,60 @@ def load_homographs_heterophones(PATH_HOMOGRAPHS_HETEROPHONES):
     f.close()
 
     return dct
+
+
+class PrefixMatcher(object):
+    """
+    Longest-prefix matcher over the prefixes loaded by load_prefixes.
+
+    The prefixes are stored in a character trie, so a lookup walks the word
+    once, whatever the number of prefixes. Exceptions are given as data,
+    tuples (syllables, prefix, phones, exact): when the word is equal to
+    (exact) or starts with syllables, the first len(prefix) characters are
+    replaced by phones. As in the original special cases, an exact exception
+    only applies to a word that already starts with one of the prefixes.
+
+    """
+
+    def __init__(self, prefixes, exceptions=()):
+        self.trie, self.exact = {}, {}
+        for prefix, phones in prefixes:
+            self.add(prefix, len(prefix), phones)
+        for syllables, prefix, phones, exact in exceptions:
+            if exact:
+                self.exact[syllables] = (len(prefix), phones)
+            else:
+                self.add(syllables, len(prefix), phones)
+
+    def add(self, key, size, phones):
+        """
+        Adds key to the trie. The first entry of a repeated key is kept, as
+        in the sequential search over the prefixes list.
+
+        """
+        node = self.trie
+        for char in key:
+            node = node.setdefault(char, {})
+        node.setdefault(None, (size, phones))
+
+    def match(self, syllables):
+        """
+        Returns the longest prefix of syllables, e.g. "an-ti-go" -> None and
+        "au-to-ma-ção" -> (5, "aʊ-to")
+
+        Args:
+            syllables: Syllables with hyphen, e.g. "au-to-ma-ção"
+
+        Returns: Tuple (number of characters of the prefix, phonemes of the
+        prefix) or None
+
+        """
+        found, node = None, self.trie
+        for char in syllables:
+            node = node.get(char)
+            if node is None:
+                break
+            found = node.get(None, found)
+        if found is not None:
+            return self.exact.get(syllables, found)
+        return found
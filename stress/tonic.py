@@ -25,6 +25,153 @@ from __future__ import unicode_literals
 import re
 
 
+# Consonants of Rule 16
+CONSTS = "bdfghjklmnñpqrstvxyz"
+
+# Rule 1: if the vowel has an accent then it is a tonic vowel
+ACCENT = re.compile("á|é|í|ó|ú|â|ê|ô|à|ã|õ", re.UNICODE)
+
+VOWEL = re.compile("a|e|i|o|u", re.UNICODE)
+
+# Rules 2 to 16, in order: (name, pattern at the end of the word, n) where
+# the tonic vowel is at len(word) - n
+ENDING_RULES = [
+    # Rule 2: if ^(0) = {r,l,z,x,n} then T = 1
+    ("r2", "[rlzxn]", 2),
+    # Rule 3: if ^(0) = {m} & ^(1) = {i,o,u} then T = 1
+    ("r3", "[iou]m", 2),
+    # Rule 4: if ^(0) = {s} & ^(1) = {n} & ^(2) = {i,o,u} then T = 1
+    ("r4", "[iou]ns", 3),
+    # Rule 5: if ^(0) = {i} & ^(1) = {u,ü} & ^(2) = {q,g} then T = 0
+    ("r5", "[qg][uü]i", 1),
+    # Rule 6: if ^(0) = {s} & ^(1) = {i} & ^(2) = {u,ü} & ^(3) = {q,g} then T = 1
+    ("r6", "[qg][uü]is", 2),
+    # Rule 7: if ^(0) = {i,u} & ^(1) = {a,e,i,o,u} then T = 1
+    ("r7a", "[aeiou][iu]", 2),
+    # if ^(0) = {i,u} & ^(1) != {a,e,i,o,u} then T = 0
+    ("r7b", "[^aeiou][iu]", 1),
+    # Rule 8: if ^(0) = {s} & ^(1) = {i,u} & ^(2) = {a,e,i,o,u} then T = 2
+    ("r8", "[aeiou][iu]s", 3),
+    # Rule 9: if ^(0) = {s} & ^(1) = {i,u} & ^(2) != {a,e,i,o,u} then T = 2
+    ("r9", "[^aeiou][iu]s", 2),
+    # Rule 10: if ^(0) = {e} & ^(1) = {u} & ^(2) = {q} & ^(3) = {r} &
+    # ^(4) = {o} & ^(4) = {p} then T = 0 (the whole word)
+    ("r10", "^porque", 1),
+    # Rule 11: if ^(0) = {e} & ^(1) = {u} & ^(2) = {qg} & ^(3) = {a,e,i,o,u}
+    # then T = 3
+    ("r11a", "[aeiou][qg]ue", 4),
+    # if ^(0) = {e} & ^(1) = {u} & ^(2) = {qg} & ^(3) != {a,e,i,o,u} then T = 4
+    ("r11b", "[^aeiou][qg]ue", 5),
+    # Rule 12: if ^(0)={e} & ^(1)={e} & ^(2)={u} & ^(3)={qg} & ^(4)={aeiou}
+    # then T = 4
+    ("r12a", "[aeiou][qg]ues", 5),
+    # if ^(0)={e} & ^(1)={e} & ^(2)={u} & ^(3)={qg} & ^(4)!={aeiou} then T = 5
+    ("r12b", "[^aeiou][qg]ues", 6),
+    # Rule 13: if ^(0) = {a,e,i,o,u} & ^(2) = {i,u} & ^(3) = {a,e,i,o,u}
+    # then T = 2
+    ("r13", "[aeiou][iu][aeiou]", 3),
+    # Rule 14: if ^(0) & ^(3) = {a,e,i,o,u} & ^(2) = {i,u} &
+    # ^(1) != {a,e,i,o,u} & ^(4) != {q,g} then T = 3
+    ("r14", "[^qg][aeiou][iu][^aeiou][aeiou]", 4),
+    # Rule 15: if ^(0) = {s} & ^(1) & ^(4) = {a,e,i,o,u} & ^(3) = {i,u} &
+    # ^(2) != {a,e,i,o,u} & ^(5) != {q,g} then T = 4
+    ("r15", "[^qg][aeiou][iu][^aeiou][aeiou]s", 5),
+    # Rule 16: if ^(0) = {a,e,o} & ^(1) = cons & ^(2) = {n} & ^(3) = {i,u} &
+    # ^(4) = {a,e,i,o,u} then T = 3
+    ("r16", "[aeiou][iu]n[" + CONSTS + "][aeo]", 4),
+]
+
+
+def _reverse_pattern(pattern):
+    """
+    Reverses a pattern made of single characters, character classes and an
+    optional leading "^", e.g. "^[qg]ue" -> "eu[qg]$"
+
+    """
+    anchored = pattern.startswith("^")
+    atoms = re.findall(r"\[[^\]]*\]|.", pattern[1:] if anchored else pattern)
+    return "".join(reversed(atoms)) + ("$" if anchored else "")
+
+
+# Rules 2 to 16 in a single pattern matched at the start of the reversed
+# word. The alternatives are tried in rule order, so the first rule that holds
+# wins, as in the original sequence of re.search calls.
+ENDINGS = re.compile(
+    "|".join(
+        "(?P<{0}>{1})".format(name, _reverse_pattern(pattern))
+        for name, pattern, _ in ENDING_RULES
+    ),
+    re.UNICODE,
+)
+
+ENDING_OFFSETS = dict((name, n) for name, _, n in ENDING_RULES)
+
+
+def stress_vowel(word):
+    """
+    Identify the tonic vowel in a word.
+
+    Args:
+        word: Input word in lower case, e.g. "chocolate"
+
+    Returns: The position of the tonic vowel in the word, e.g. 6 -> 'o'
+
+    """
+    # Rule 1:
+    # If the vowel has an accent then it is a tonic vowel
+    match = ACCENT.search(word)
+    if match:
+        return match.start()
+
+    # TODO Word with len(word) > 2
+
+    # Rules 2 to 16
+    match = ENDINGS.match(word[::-1])
+    if match:
+        return len(word) - ENDING_OFFSETS[match.lastgroup]
+
+    # Rule 17:
+    matches = [m.start() for m in VOWEL.finditer(word)]
+    if len(matches) >= 2:
+        k = matches[-2]
+        v = ["a", "e", "i", "o", "u"]
+        if word[k] in ["i", "u"] and word[k - 1] in v and not word[k + 1] in v:
+            if k - 2 < 0:
+                return 0
+            if not word[k - 2] in ["q", "g"]:
+                return k - 1
+
+    # Rule 18:
+    # if ^(0) = {m} & ^(1) = {e} & ^(2) = {u} & ^(3) = {q} then T = 1
+    if word == "quem":
+        return len(word) - 2
+
+    # Rule 19:
+    # Penultimate vowel of the word
+    if len(matches) >= 2:
+        return matches[-2]
+
+    return -1
+
+
+def stress_vowels(words):
+    """
+    Identify the tonic vowel of a list of words, computing each distinct word
+    once.
+
+    Args:
+        words: Input words, e.g. ["chocolate", "casa"]
+
+    Returns: List of positions of the tonic vowels, e.g. [6, 1]
+
+    """
+    done = {}
+    for word in words:
+        if word not in done:
+            done[word] = StressDetector(word).get_stress_vowel()
+    return [done[word] for word in words]
+
+
 class StressDetector(object):
     """
     This class implements the tonic/stress detection presented in
@@ -41,140 +188,19 @@ class StressDetector(object):
             self.word = word.decode("utf-8").lower()
         except:
             self.word = word.lower()
+        self._stress_vowel = None
 
     def get_stress_vowel(self):
         """
-        Identify the tonic vowel in a word.
-
-        Args:
-            word: Input word, e.g. "chocolate"
+        Identify the tonic vowel in a word. The result is computed once and
+        reused by the other methods.
 
         Returns: The position of the tonic vowel in the word, e.g. 6 -> 'o'
 
         """
-        # Rule 1:
-        # If the vowel has an accent then it is a tonic vowel
-        match = re.search("á|é|í|ó|ú|â|ê|ô|à|ã|õ", self.word, re.UNICODE)
-        if match:
-            return match.start()
-
-        # TODO Word with len(word) > 2
-
-        # Rule 2: if ^(0) = {r,l,z,x,n} then T = 1
-        if re.search("[rlzxn]$", self.word, re.UNICODE):
-            return len(self.word) - 2
-
-        # Rule 3:
-        # if ^(0) = {m} & ^(1) = {i,o,u} then T = 1
-        if re.search("[iou]m$", self.word, re.UNICODE):
-            return len(self.word) - 2
-
-        # Rule 4:
-        # if ^(0) = {s} & ^(1) = {n} & ^(2) = {i,o,u} then T = 1
-        if re.search("[iou]ns$", self.word, re.UNICODE):
-            return len(self.word) - 3
-
-        # Rule 5:
-        # if ^(0) = {i} & ^(1) = {u,ü} & ^(2) = {q,g} then T = 0
-        if re.search("[qg][uü]i$", self.word, re.UNICODE):
-            return len(self.word) - 1
-
-        # Rule 6:
-        # if ^(0) = {s} & ^(1) = {i} & ^(2) = {u,ü} & ^(3) = {q,g} then T = 1
-        if re.search("[qg][uü]is$", self.word, re.UNICODE):
-            return len(self.word) - 2
-
-        # Rule 7:
-        # if ^(0) = {i,u} & ^(1) = {a,e,i,o,u} then T = 1
-        if re.search("[aeiou][iu]$", self.word, re.UNICODE):
-            return len(self.word) - 2
-        # if ^(0) = {i,u} & ^(1) != {a,e,i,o,u} then T = 0
-        if re.search("[^aeiou][iu]$", self.word, re.UNICODE):
-            return len(self.word) - 1
-
-        # Rule 8:
-        # if ^(0) = {s} & ^(1) = {i,u} & ^(2) = {a,e,i,o,u} then T = 2
-        if re.search("[aeiou][iu]s$", self.word, re.UNICODE):
-            return len(self.word) - 3
-
-        # Rule 9:
-        # if ^(0) = {s} & ^(1) = {i,u} & ^(2) != {a,e,i,o,u} then T = 2
-        if re.search("[^aeiou][iu]s$", self.word, re.UNICODE):
-            return len(self.word) - 2
-
-        # Rule 10:
-        # if ^(0) = {e} & ^(1) = {u} & ^(2) = {q} & ^(3) = {r} & ^(4) = {o} &
-        # ^(4) = {p} then T = 0
-        if self.word == "porque":
-            return len(self.word) - 1
-
-        # Rule 11
-        # if ^(0) = {e} & ^(1) = {u} & ^(2) = {qg} & ^(3) = {a,e,i,o,u} then T = 3
-        if re.search("[aeiou][qg]ue$", self.word, re.UNICODE):
-            return len(self.word) - 4
-        # if ^(0) = {e} & ^(1) = {u} & ^(2) = {qg} & ^(3) != {a,e,i,o,u} then T = 4
-        if re.search("[^aeiou][qg]ue$", self.word, re.UNICODE):
-            return len(self.word) - 5
-
-        # Rule 12
-        # if ^(0)={e} & ^(1)={e} & ^(2)={u} & ^(3)={qg} & ^(4)={aeiou} then T = 4
-        if re.search("[aeiou][qg]ues$", self.word, re.UNICODE):
-            return len(self.word) - 5
-        # if ^(0)={e} & ^(1)={e} & ^(2)={u} & ^(3)={qg} & ^(4)!={aeiou} then T = 5
-        if re.search("[^aeiou][qg]ues$", self.word, re.UNICODE):
-            return len(self.word) - 6
-
-        # Rule 13:
-        # if ^(0) = {a,e,i,o,u} & ^(2) = {i,u} & ^(3) = {a,e,i,o,u} then T = 2
-        if re.search("[aeiou][iu][aeiou]$", self.word, re.UNICODE):
-            return len(self.word) - 3
-
-        # Rule 14:
-        # if ^(0) & ^(3) = {a,e,i,o,u} & ^(2) = {i,u} & ^(1) != {a,e,i,o,u} &
-        # ^(4) != {q,g} then T = 3
-        if re.search("[^qg][aeiou][iu][^aeiou][aeiou]$", self.word, re.UNICODE):
-            return len(self.word) - 4
-
-        # Rule 15:
-        # if ^(0) = {s} & ^(1) & ^(4) = {a,e,i,o,u} & ^(3) = {i,u} &
-        # ^(2) != {a,e,i,o,u} & ^(5) != {q,g} then T = 4
-        if re.search("[^qg][aeiou][iu][^aeiou][aeiou]s$", self.word, re.UNICODE):
-            return len(self.word) - 5
-
-        # Rule 16:
-        # if ^(0) = {a,e,o} & ^(1) = cons & ^(2) = {n} & ^(3) = {i,u} &
-        # ^(4) = {a,e,i,o,u} then T = 3
-        consts = "bdfghjklmnñpqrstvxyz"
-        if re.search("[aeiou][iu]n[" + consts + "][aeo]$", self.word, re.UNICODE):
-            return len(self.word) - 4
-
-        # Rule 17:
-        matches = [m.start() for m in re.finditer("a|e|i|o|u", self.word, re.UNICODE)]
-        if len(matches) >= 2:
-            k = matches[-2]
-            v = ["a", "e", "i", "o", "u"]
-            if (
-                self.word[k] in ["i", "u"]
-                and self.word[k - 1] in v
-                and not self.word[k + 1] in v
-            ):
-                if k - 2 < 0:
-                    return 0
-                if not self.word[k - 2] in ["q", "g"]:
-                    return k - 1
-
-        # Rule 18:
-        # if ^(0) = {m} & ^(1) = {e} & ^(2) = {u} & ^(3) = {q} then T = 1
-        if self.word == "quem":
-            return len(self.word) - 2
-
-        # Rule 19:
-        # Penultimate vowel of the word
-        matches = [m.start() for m in re.finditer("a|e|i|o|u", self.word, re.UNICODE)]
-        if len(matches) >= 2:
-            return matches[-2]
-
-        return -1
+        if self._stress_vowel is None:
+            self._stress_vowel = stress_vowel(self.word)
+        return self._stress_vowel
 
     def get_stress_vowel_with_hyphen(self, syllables):
         """
@@ -24,7 +24,212 @@
 from __future__ import unicode_literals
 
 
+# CECI table: the first line has the letters, line i + 1 the action for
+# letter i followed by each letter (blank = 0)
+TAB_CECI = [
+    " aáãâbcçdeéêfghiíjklmnoóôõpqrstuúüvwxyz",
+    "a11113311011111111111101101111101 1 101",
+    "á    11110  11 0 111110   111111  1 101",
+    "ã        0            0      0       0 ",
+    "â    11110     11111110   11111 1 1 101",
+    "b000022 200022 002 0220000220220002  0 ",
+    "c0000 22 000  000  0240000  002000   0 ",
+    "ç0000    000   0      0000     000   0 ",
+    "d0000222200022200222220000220220002  00",
+    "e1  1111111 11 0111111111 111110101 101",
+    "é0   1111   11 0 1 1110   111110  1 101",
+    "ê0   1111   11   1 1110   111110  1 101",
+    "f0000    000   00  0 20000  0 2000   0 ",
+    "g0000    000  000  0240000  0  000   0 ",
+    "h0000    000   00     0000     000   0 ",
+    "i1111111111111 111 11111111111111 1 101",
+    "í1   11111  11 1 111111   11111   1 101",
+    "j0000    000   00     0000     000   0 ",
+    "k0000    000   00  0 40000  0  000   0 ",
+    "l0000222200022000220220000222220002 202",
+    "m00002   000   00   2400002    000   0 ",
+    "n0000 22200022000222220000 22220002 202",
+    "o0111311101111 011111111111111101 11101",
+    "ó0   1111   11 0 111111   11111   1 101",
+    "ô0   1111   11   1 111    11111   1 101",
+    "õ        0                           0 ",
+    "p0000 22 000  000  0 40000  044000   0 ",
+    "q0000    000   00  0  0000  0  000   0 ",
+    "r0000222200022000222220000222220002 202",
+    "s00002222000220002222200002222200022202",
+    "t0000    000  000  0020000  020000   0 ",
+    "u0111111101111 011111101101111111 1 101",
+    "ú1   11111  11 1 111111   11101   1 101",
+    "ü        000   00     0000           0 ",
+    "v0000    000  000  0  0000  0  000   0 ",
+    "w0000    000  000  0  0000  0  000   0 ",
+    "x0000222200022 002222200002222200022202",
+    "y00001111000110001111100001111100011111",
+    "z00002222000220002222200002222200022222",
+    ]
+
+LETTERS = TAB_CECI[0][1:]
+
+# Codes of the characters: the letters of the table, then any non-alphabetic
+# character and any letter missing from the table
+CODES = dict((letter, i) for i, letter in enumerate(LETTERS))
+NON_ALPHA = len(LETTERS)
+UNKNOWN = len(LETTERS) + 1
+WIDTH = len(LETTERS) + 2
+
+# Action of a pair of letters with one of them missing from the table
+NO_ACTION = -1
+
+VOWELS = "aáãâeéêiíoóôõuúü"
+
+
+def _build_actions():
+    """
+    Returns the CECI table as a flat list of actions indexed by
+    code(la) * WIDTH + code(le). As in the original letters.index lookups, a
+    non-alphabetic la gives 2, otherwise a non-alphabetic le gives 3, and a
+    pair of letters with one of them missing from the table has no action.
+
+    """
+    actions = [NO_ACTION] * (WIDTH * WIDTH)
+    for i, line in enumerate(TAB_CECI[1:]):
+        for j, t in enumerate(line[1:]):
+            actions[i * WIDTH + j] = 0 if t.isspace() else int(t)
+    for i in list(range(len(LETTERS))) + [UNKNOWN]:
+        actions[i * WIDTH + NON_ALPHA] = 3
+    for j in range(WIDTH):
+        actions[NON_ALPHA * WIDTH + j] = 2
+    return actions
+
+
+ACTIONS = _build_actions()
+
+
+# Codes of every character seen so far (upper case letters have the code
+# of the lower case ones)
+_CHAR_CODES = dict(CODES)
+
+
+def _code(char):
+    code = _CHAR_CODES.get(char)
+    if code is None:
+        lower = char.lower()
+        code = CODES.get(lower, UNKNOWN if lower.isalpha() else NON_ALPHA)
+        _CHAR_CODES[char] = code
+    return code
+
+
+def _run(word):
+    """
+    Runs the CECI table over word followed by a space.
+
+    Returns: List with the characters of the syllables separated by spaces and
+    the number of syllables counted, e.g. (list("ca sa "), 3)
+
+    """
+    result = [word[0]]
+    word += " "
+    codes = list(map(_CHAR_CODES.get, word))
+    if None in codes:
+        codes = [_code(c) for c in word]
+    no_syllables = 1
+    start_syllable = True
+
+    actions = ACTIONS
+    for _la in range(len(word) - 1):
+        _le = _la + 1
+        action = actions[codes[_la] * WIDTH + codes[_le]]
+
+        if action == 0:
+            result.append(word[_le])
+            start_syllable = False
+            continue
+        if action == NO_ACTION:
+            raise ValueError("Letter not in the CECI table")
+        if action == 2:
+            if start_syllable and no_syllables > 1:
+                result[-2:] = result[-1:]
+                no_syllables -= 1
+        elif action == 3:
+            if (
+                start_syllable
+                and word[_la].lower() not in VOWELS
+                and no_syllables != 1
+            ):
+                if len(result) > 2:
+                    result[-2:] = result[-1:]
+                no_syllables -= 1
+        elif action == 4:
+            if start_syllable and no_syllables == 1:
+                result.append(word[_le])
+                start_syllable = False
+                continue
+            if start_syllable and no_syllables > 1:
+                result[-2:] = result[-1:]
+                no_syllables -= 1
+        # Actions 1 to 4 start a new syllable
+        result.append(" ")
+        result.append(word[_le])
+        no_syllables += 1
+        start_syllable = True
+
+    return result, no_syllables
+
+
 class CECISyllableSeparator(object):
+    def __init__(self, word):
+        # try:
+        #     self.word = word.decode("utf-8").lower()
+        # except (UnicodeDecodeError, UnicodeEncodeError):
+        #     self.word = word.lower()
+        self.word = word.lower()
+
+    def separate(self):
+        # A leading crasis is kept: "à" is not in the table, so it raises
+        # ValueError when followed by a letter, as in the original code
+        result, _ = _run(self.word)
+        return "".join(result).split()
+
+    def no_syllables(self, word):
+        if word[0] == "à":
+            word = "a" + word[1:]
+        _, no_syllables = _run(word)
+        return no_syllables - 1
+
+    tab_ceci = TAB_CECI
+
+
+def separate_many(words):
+    """
+    Separates the syllables of a list of words, computing each distinct word
+    once. As in G2PTranscriber.get_syllables, a word that cannot be separated
+    gives [word].
+
+    Args:
+        words: Input words, e.g. ["chocolate", "casa"]
+
+    Returns: List of syllables of each word, e.g. [['cho', 'co', 'la', 'te'],
+    ['ca', 'sa']]
+
+    """
+    done = {}
+    for word in words:
+        if word not in done:
+            try:
+                done[word] = CECISyllableSeparator(word).separate()
+            except (ValueError, IndexError):
+                done[word] = [word]
+    return [done[word] for word in words]
+
+
+class CECISyllableSeparatorRef(object):
+    """
+    Original implementation, kept as reference for the benchmarks: every
+    action is looked up with letters.index in tab_ceci.
+
+    """
+
+
     def __init__(self, word):
         # try:
         #     self.word = word.decode("utf-8").lower()
@@ -171,44 +376,4 @@ class CECISyllableSeparator(object):
 
         return no_syllables - 1
 
-    tab_ceci = [
-        " aáãâbcçdeéêfghiíjklmnoóôõpqrstuúüvwxyz",
-        "a11113311011111111111101101111101 1 101",
-        "á    11110  11 0 111110   111111  1 101",
-        "ã        0            0      0       0 ",
-        "â    11110     11111110   11111 1 1 101",
-        "b000022 200022 002 0220000220220002  0 ",
-        "c0000 22 000  000  0240000  002000   0 ",
-        "ç0000    000   0      0000     000   0 ",
-        "d0000222200022200222220000220220002  00",
-        "e1  1111111 11 0111111111 111110101 101",
-        "é0   1111   11 0 1 1110   111110  1 101",
-        "ê0   1111   11   1 1110   111110  1 101",
-        "f0000    000   00  0 20000  0 2000   0 ",
-        "g0000    000  000  0240000  0  000   0 ",
-        "h0000    000   00     0000     000   0 ",
-        "i1111111111111 111 11111111111111 1 101",
-        "í1   11111  11 1 111111   11111   1 101",
-        "j0000    000   00     0000     000   0 ",
-        "k0000    000   00  0 40000  0  000   0 ",
-        "l0000222200022000220220000222220002 202",
-        "m00002   000   00   2400002    000   0 ",
-        "n0000 22200022000222220000 22220002 202",
-        "o0111311101111 011111111111111101 11101",
-        "ó0   1111   11 0 111111   11111   1 101",
-        "ô0   1111   11   1 111    11111   1 101",
-        "õ        0                           0 ",
-        "p0000 22 000  000  0 40000  044000   0 ",
-        "q0000    000   00  0  0000  0  000   0 ",
-        "r0000222200022000222220000222220002 202",
-        "s00002222000220002222200002222200022202",
-        "t0000    000  000  0020000  020000   0 ",
-        "u0111111101111 011111101101111111 1 101",
-        "ú1   11111  11 1 111111   11101   1 101",
-        "ü        000   00     0000           0 ",
-        "v0000    000  000  0  0000  0  000   0 ",
-        "w0000    000  000  0  0000  0  000   0 ",
-        "x0000222200022 002222200002222200022202",
-        "y00001111000110001111100001111100011111",
-        "z00002222000220002222200002222200022222",
-    ]
+    tab_ceci = TAB_CECI
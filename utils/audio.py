@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+Acesso sob demanda a arquivos WAV.
+
+O arquivo é mapeado em memória (wavfile.read com mmap=True) e nada é copiado
+na abertura. O pico usado na normalização é obtido em uma passada por blocos
+e somente os trechos pedidos em segment(nIni, nFim) são convertidos para
+float, já em mono e normalizados como em:
+
+    audio = np.mean(audio, axis=1)          # se estéreo
+    audio = audio/np.max(np.abs(audio))
+
+Formatos que o scipy não consegue mapear (ex.: 24 bits) são lidos por inteiro,
+como antes. O scipy.io só é importado ao abrir o primeiro arquivo.
+"""
+import numpy as np
+
+# Número de amostras por bloco na passada que calcula o pico
+PEAK_BLOCK = 2**20
+
+class AudioReader(object):
+    def __init__(self, filename, block=PEAK_BLOCK):
+        self.filename = filename
+        self.block = block
+        from scipy.io import wavfile
+        try:
+            self.sr, self.data = wavfile.read(filename, mmap=True)
+        except ValueError:
+            self.sr, self.data = wavfile.read(filename)
+        self.nSamples = self.data.shape[0]
+        self.nChannel = self.data.shape[1] if (self.data.ndim > 1) else 1
+        self._peak = None
+
+    def __len__(self):
+        return self.nSamples
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        # Libera o mapeamento do arquivo
+        self.data = None
+
+    def _mono(self, nIni, nFim):
+        x = self.data[nIni:nFim]
+        if (self.nChannel > 1):
+            return np.mean(x,axis=1)
+        return x.astype(np.float64)
+
+    @property
+    def peak(self):
+        '''
+        Maior valor absoluto do sinal mono, calculado por blocos de self.block
+        amostras na primeira consulta.
+        '''
+        if (self._peak is None):
+            peak = 0.0
+            for b in range(0,self.nSamples,self.block):
+                peak = max(peak,np.max(np.abs(self._mono(b,b+self.block))))
+            self._peak = peak
+        return self._peak
+
+    def segment(self, nIni, nFim):
+        '''
+        Retorna as amostras [nIni:nFim] em float64, mono e normalizadas pelo
+        pico do arquivo inteiro.
+        '''
+        return self._mono(nIni,nFim)/self.peak
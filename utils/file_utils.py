@@ -8,10 +8,12 @@ Created on Wed Aug  3 02:18:32 2022
 import os
 from pathlib import Path
 import numpy as np
-from scipy.fft import fft
-from scipy.integrate import simpson
-from chardet.universaldetector import UniversalDetector
+from functools import lru_cache
 import subprocess
+from .textgrid import iter_textgrid_tiers
+from .formant_lpc import frame_signal, FRAME_BLOCK
+# scipy.fft, scipy.integrate e chardet são importados no primeiro uso, dentro
+# das funções, e não na importação do módulo
 # -----------------------------------------------------------------------------
 def simpson_integral(t,f):
     Nf = len(f)
@@ -24,39 +26,49 @@ def simpson_integral(t,f):
             + 4*np.sum(f[1:N-1:2]) + f[N-1])
     return I_simp
 # -----------------------------------------------------------------------------
+@lru_cache(maxsize=16)
+def simpson_weights(n, fMax):
+    '''
+    Pesos w tais que simpson(y, x=np.linspace(0,fMax,n)) = np.dot(y, w) para
+    qualquer y (a regra de Simpson é linear em y).
+    '''
+    from scipy.integrate import simpson
+    w = simpson(np.eye(n), x=np.linspace(0,fMax,n), axis=1)
+    w.flags.writeable = False
+    return w
+# -----------------------------------------------------------------------------
 def spectral_ratios(audio, sr, time_step, nFFT = 1024):
-    LTF = []
-    COG_1 = []
-    COG_2 = []
-    COG_23 = []
+    from scipy.fft import rfft
     nStep = int(time_step*sr)
     if (nStep > nFFT):
         nFFT = int(2**np.ceil(np.log2(nStep)))
     hFFT = int(0.5*nFFT)
     f = np.linspace(0,0.5*sr,hFFT)
-    wAudio = np.zeros((nFFT,))
     lowFilter = np.zeros((len(f)))
     idxLow = (f <= 850).nonzero()[0]
     idxSmt = np.multiply((f >= 850),(f <= 950)).nonzero()[0]
     lowFilter[idxLow] = 1
     lowFilter[idxSmt] = (950 - f[idxSmt])/100
-    for i in range(0,len(audio)-nStep,nStep):
-        
-        wAudio[:nStep] = audio[i:(i+nStep)]
-        faudio = np.abs(fft(wAudio,n=nFFT)[:hFFT])
-        lfaudio = np.multiply(lowFilter,faudio)
-        lfpower = simpson(lfaudio,x=f)
-        
-        fpower_1 = simpson(faudio,x=f)
-        fpower_2 = simpson(np.power(faudio,2),x=f)
-        fpower_23 = simpson(np.power(faudio,2/3),x=f)
-        fint_1 = simpson(np.multiply(f,faudio),x=f)
-        fint_2 = simpson(np.multiply(f,np.power(faudio,2)),x=f)
-        fint_23 = simpson(np.multiply(f,np.power(faudio,2/3)),x=f)
-        COG_1.append(fint_1/fpower_1)
-        COG_2.append(fint_2/fpower_2)
-        COG_23.append(fint_23/fpower_23)
-        LTF.append(2*(fpower_1 - lfpower)/sr)
+    # Cada integral de Simpson vira um produto matriz-vetor sobre todos os quadros
+    w = simpson_weights(hFFT,0.5*sr)
+    fw = f*w
+    lw = lowFilter*w
+    frames = frame_signal(np.asarray(audio,dtype=np.float64),nStep,nStep)
+    nFrames = frames.shape[0]
+    COG_1 = np.zeros((nFrames,))
+    COG_2 = np.zeros((nFrames,))
+    COG_23 = np.zeros((nFrames,))
+    LTF = np.zeros((nFrames,))
+    for b in range(0,nFrames,FRAME_BLOCK):
+        faudio = np.abs(rfft(frames[b:b+FRAME_BLOCK],n=nFFT,axis=1)[:,:hFFT])
+        faudio2 = faudio**2
+        faudio23 = faudio**(2/3)
+        k = faudio.shape[0]
+        fpower_1 = faudio.dot(w)
+        COG_1[b:b+k] = faudio.dot(fw)/fpower_1
+        COG_2[b:b+k] = faudio2.dot(fw)/faudio2.dot(w)
+        COG_23[b:b+k] = faudio23.dot(fw)/faudio23.dot(w)
+        LTF[b:b+k] = 2*(fpower_1 - faudio.dot(lw))/sr
     return COG_1, COG_2, COG_23, LTF
 # -----------------------------------------------------------------------------
 def list_contend(folder='./', pattern=()):
@@ -87,6 +99,7 @@ def check_utf8(filename):
     resutl_utf8 = False
     oriCode = ''
     if os.path.exists(filename):
+        from chardet.universaldetector import UniversalDetector
         u = UniversalDetector()
         u.reset()
         with open(filename, "rb") as f:
@@ -95,11 +108,77 @@ def check_utf8(filename):
                 if u.done:
                     break
         u.close()
-        oriCode = u.result['encoding'].lower()
+        # Arquivo vazio ou binário: encoding None
+        oriCode = (u.result['encoding'] or '').lower()
         resutl_utf8 = oriCode == 'utf-8'
     return resutl_utf8, oriCode
 # -----------------------------------------------------------------------------
-def textgrid_to_interval_matrix(filename, anyLabel=1, labelValue="", convertNumber=0,tierNumber=-1):
+def textgrid_to_interval_matrix(filename, anyLabel=1, labelValue="", convertNumber=0,tierNumber=-1,tiers=None):
+    '''filename:   endereço completo do arquivo .textgrid (formato longo, curto ou cronológico)
+       anyValue:   Se anyLabel = 0 lista os intervalos indicados em labelValue
+                   Se anyLabel = 1 (padrão) lista apenas os intervalos com etiqueta diferente de vazio
+                   Se anyLabel = -1 lista todos intervalos inclusive os vazios
+       labelValue: valor da etiqueta (do inervalo) a ser buscado. Padrão = "". Se especificado
+                   retorna apenas os intervalos que contem a etiqueta igual a labelValue
+       convertNumber: Se convertNumber=0 (padrão) retorna o valor da etiqueta como string
+                      Se convertNumber=1 tenta realizar a conversão do conteúdo da etiqueta para valor numérico
+       tierNumber:    Especifica a camada para realizar a busca.
+                     Se tierNumber=-1 (padrão) realiza a busca em todas as camadas
+                     A primeira camada é tierNumber=0
+       tiers:      índices das camadas a serem lidas. As demais são puladas durante a leitura
+                   e retornadas como listas vazias. Se tiers=None (padrão) lê todas as camadas.
+    Arquivos que não estão em UTF-8 são lidos com a codificação detectada (chardet) e não
+    são mais convertidos no disco: textgrid_to_interval_matrix_ref reescrevia o arquivo em
+    UTF-8 com iconv (convert_utf8).
+    '''
+    tierMatrix = []
+    file_suffix = Path(filename).suffix.upper()
+    if (file_suffix != ".TEXTGRID"):
+        print("Erro: arquivo não possui extensão do tipo textgrid.")
+    
+    try:
+        isUTF8, fromCode = check_utf8(filename)
+        encoding = None if (isUTF8 or (fromCode in ('ascii', ''))) else fromCode
+        for tier in iter_textgrid_tiers(filename, tiers=tiers, encoding=encoding):
+            newTier = []
+            tierMatrix.append(newTier)
+            if (tier.items is None):
+                continue
+            isInterval = (tier.tierClass == "IntervalTier")
+            if not isInterval:
+                print("Aviso: Saltando camada {:} que não é do tipo de intervalos...".format(tier.index))
+            for item in tier.items:
+                itv_textT = item.text.strip().replace('"','')
+                insertValue = True
+                if (anyLabel == 0) and (itv_textT != labelValue): 
+                    insertValue = False  
+                if (anyLabel == 1) and (len(itv_textT) == 0):
+                    insertValue = False     
+                if insertValue:
+                    if (convertNumber):
+                        try:
+                            itv_text = float(itv_textT)
+                        except:
+                            print("Erro: Conversao para valor numerico não e possivel de valor {:}".format(itv_textT))
+                    else:
+                        itv_text = itv_textT
+                    if isInterval:
+                        newTier.append([item.xmin,item.xmax,itv_text])
+                    else:
+                        newTier.append([item.xmin,itv_text])
+    except (OSError, ValueError, StopIteration) as e:
+        print("Erro:Problema de leitura do arquivo textgrid: {:}".format(e))
+        return tierMatrix
+    
+    nTiers = len(tierMatrix)
+    if (tierNumber > 0) and (tierNumber >= nTiers):
+        print("Erro: Indicadca camada {:}. O arquivo textgrit possui {:} camadas. Selecione uma camada entre 0 e {:}.".format(tierNumber,nTiers,nTiers-1))
+    
+    return tierMatrix
+# -----------------------------------------------------------------------------
+# Implementação original, com leitura do arquivo inteiro por readlines(),
+# mantida como referência
+def textgrid_to_interval_matrix_ref(filename, anyLabel=1, labelValue="", convertNumber=0,tierNumber=-1):
     '''filename:   endereço completo do arquivo .textgrid
        anyValue:   Se anyLabel = 0 lista os intervalos indicados em labelValue
                    Se anyLabel = 1 (padrão) lista apenas os intervalos com etiqueta diferente de vazio
@@ -213,15 +292,42 @@ def textgrid_to_interval_matrix(filename, anyLabel=1, labelValue="", convertNumb
                     newTier.append([itv_xmin,itv_xmax,itv_text])    
         tierMatrix.append(newTier)    
         
-    return tierMatrix  
-            
-            
-            
-            
-            
-            
-            
-            
-            
-            
-            
+    return tierMatrix
+# -----------------------------------------------------------------------------
+# Implementacao original, quadro a quadro, mantida como referencia
+def spectral_ratios_ref(audio, sr, time_step, nFFT = 1024):
+    from scipy.fft import fft
+    from scipy.integrate import simpson
+    LTF = []
+    COG_1 = []
+    COG_2 = []
+    COG_23 = []
+    nStep = int(time_step*sr)
+    if (nStep > nFFT):
+        nFFT = int(2**np.ceil(np.log2(nStep)))
+    hFFT = int(0.5*nFFT)
+    f = np.linspace(0,0.5*sr,hFFT)
+    wAudio = np.zeros((nFFT,))
+    lowFilter = np.zeros((len(f)))
+    idxLow = (f <= 850).nonzero()[0]
+    idxSmt = np.multiply((f >= 850),(f <= 950)).nonzero()[0]
+    lowFilter[idxLow] = 1
+    lowFilter[idxSmt] = (950 - f[idxSmt])/100
+    for i in range(0,len(audio)-nStep,nStep):
+        
+        wAudio[:nStep] = audio[i:(i+nStep)]
+        faudio = np.abs(fft(wAudio,n=nFFT)[:hFFT])
+        lfaudio = np.multiply(lowFilter,faudio)
+        lfpower = simpson(lfaudio,x=f)
+        
+        fpower_1 = simpson(faudio,x=f)
+        fpower_2 = simpson(np.power(faudio,2),x=f)
+        fpower_23 = simpson(np.power(faudio,2/3),x=f)
+        fint_1 = simpson(np.multiply(f,faudio),x=f)
+        fint_2 = simpson(np.multiply(f,np.power(faudio,2)),x=f)
+        fint_23 = simpson(np.multiply(f,np.power(faudio,2/3)),x=f)
+        COG_1.append(fint_1/fpower_1)
+        COG_2.append(fint_2/fpower_2)
+        COG_23.append(fint_23/fpower_23)
+        LTF.append(2*(fpower_1 - lfpower)/sr)
+    return COG_1, COG_2, COG_23, LTF
@@ -1,28 +1,131 @@
 # -*- coding: utf-8 -*-
 
 import numpy as np
-from .lpc import levinson_1d, lpc_ref
-from scipy.signal import lfilter, fftconvolve
-from scipy.signal.windows import hamming, kaiser
+from numpy.lib.stride_tricks import sliding_window_view
+from .lpc import levinson_1d, lpc_ref, lpc_batch
+# O scipy.signal (centenas de ms) é importado no primeiro uso, dentro das
+# funções, e não na importação do módulo
+
+# Numero maximo de quadros processados de uma vez (limita a memoria em
+# sinais longos, como um arquivo inteiro)
+FRAME_BLOCK = 2048
+
+# Limites dos candidatos a formante em format_lpc: polos abaixo de
+# FORMANT_MIN_FREQ (Hz) ou com largura de banda acima de FORMANT_MAX_BANDWIDTH
+# (Hz) modelam a inclinacao espectral e nao ocupam as posicoes F1, F2, ...
+FORMANT_MIN_FREQ = 90
+FORMANT_MAX_BANDWIDTH = 400
+
+def frame_signal(audio, nWin, nStep):
+    # Quadros iniciando em range(0, nPts - nWin, nStep), como visao 2-D sem copia
+    nPts = len(audio)
+    if (nPts <= nWin):
+        return np.zeros((0,nWin))
+    return sliding_window_view(audio,nWin)[0:nPts-nWin:nStep]
+
+def lpc_roots(a):
+    # Raizes de cada linha de a (a[:,0] = 1) pelos autovalores das matrizes
+    # companheiras de todos os quadros em uma unica chamada
+    nFrames, p = a.shape[0], a.shape[1] - 1
+    C = np.zeros((nFrames,p,p))
+    C[:,0,:] = -a[:,1:]/a[:,:1]
+    C[:,np.arange(1,p),np.arange(p-1)] = 1
+    return np.linalg.eigvals(C)
+
+def formant_slots(rs, sr, nFormReq, maxFreq, minFreq=0, maxBandwidth=None):
+    # Formantes e larguras de banda de cada quadro a partir das raizes rs
+    # (uma linha por quadro). Candidatos: polos com frequencia entre minFreq e
+    # maxFreq e largura de banda ate maxBandwidth (None = sem limite). Os
+    # candidatos ocupam F1, F2, ... em ordem crescente de frequencia; as
+    # posicoes que sobram ficam com zero
+    ff = np.angle(rs)*sr*0.5/np.pi
+    bb = -np.log(np.abs(rs))*sr/np.pi
+    valid = (ff>minFreq)*(ff<maxFreq)
+    if (maxBandwidth is not None):
+        valid = valid*(bb<=maxBandwidth)
+    # Invalidos vao para o fim da ordenacao
+    fi = np.argsort(np.where(valid,ff,np.inf),axis=1)[:,:nFormReq]
+    sel = np.take_along_axis(valid,fi,axis=1)
+    F = np.where(sel,np.take_along_axis(ff,fi,axis=1),0)
+    B = np.where(sel,np.take_along_axis(bb,fi,axis=1),0)
+    nPad = nFormReq - F.shape[1]
+    if (nPad > 0):
+        F = np.pad(F,((0,0),(0,nPad)))
+        B = np.pad(B,((0,0),(0,nPad)))
+    return F, B
+
+def mean_formant(track, pIni, pFim):
+    # Media de uma trilha de formante (uma linha de F de format_lpc) entre as
+    # fracoes pIni e pFim do intervalo, como getMeanPercentualInterval de P00,
+    # mas so sobre os quadros com formante: as posicoes vazias (zero, ex.: polo
+    # removido pelo filtro de largura de banda) nao entram na media. Sem
+    # nenhum quadro com formante o resultado e zero (e nan sem nenhum quadro,
+    # como antes)
+    nPoints = len(track)
+    sel = np.asarray(track[int(np.floor(pIni*nPoints)):int(np.ceil(pFim*nPoints))])
+    valid = sel[sel > 0]
+    if (len(sel) > 0) and (len(valid) == 0):
+        return 0.0
+    return np.mean(valid)
+
+def same_conv_weights(w):
+    # Pesos g tais que np.mean(fftconvolve(x,w,mode='same')) = np.dot(x,g)/len(w),
+    # obtidos pela soma acumulada de w
+    nWin = len(w)
+    st = (nWin-1)//2
+    cw = np.concatenate(([0.],np.cumsum(w)))
+    k = np.arange(nWin)
+    return cw[np.minimum(nWin,st+nWin-k)] - cw[np.maximum(0,st-k)]
 
 def intensity(audio,sr, winlen=0.025, winstep=0.01):
+    from scipy.signal import lfilter
+    from scipy.signal.windows import kaiser
     nWin = int(winlen*sr)
     nStep = int(winstep*sr)
-    # audio = np.concatenate((audio,np.zeros((nWin,))))
     nPts = len(audio)
     nFrames = int((nPts-nWin)/nStep + 1)
     I = np.zeros((nFrames,))
-    
-    # G = np.zeros(nFrames,)
-    k = 0
     audio = lfilter([1., -.975], 1, audio) 
-    for j in range(0,nPts-nWin,nStep):    
-        Ia = fftconvolve(audio[j:j+nWin]**2,kaiser(nWin, beta=20),mode='same')
-        I[k] = 20*np.log10(np.mean(Ia)/2e-5)
-        k = k+1
+    g = same_conv_weights(kaiser(nWin, beta=20))
+    # Energia de cada bloco de quadros em um unico produto matriz-vetor
+    frames = frame_signal(audio**2,nWin,nStep)
+    for b in range(0,frames.shape[0],FRAME_BLOCK):
+        Ia = frames[b:b+FRAME_BLOCK].dot(g)/nWin
+        I[b:b+len(Ia)] = 20*np.log10(Ia/2e-5)
     return I
 
-def format_lpc(audio,sr, nFormReq=4, maxFreq = 4000, winlen=0.01, winstep=0.01):
+def format_lpc(audio,sr, nFormReq=4, maxFreq = 4000, winlen=0.01, winstep=0.01,
+               minFreq=FORMANT_MIN_FREQ, maxBandwidth=FORMANT_MAX_BANDWIDTH):
+    # Com minFreq = 0 e maxBandwidth = None o resultado e o de format_lpc_ref
+    from scipy.signal import lfilter
+    from scipy.signal.windows import hamming
+    if (0.5*sr > maxFreq):
+        nForm = int(0.5*sr/1000)
+    if (0.5*sr < maxFreq):
+        maxFreq = 0.5*sr
+    order = 2*nForm+1
+    nWin = int(winlen*sr)
+    nStep = int(winstep*sr)
+    nPts = len(audio)
+    nFrames = int((nPts-nWin)/nStep + 1)
+    F = np.zeros((nFormReq,nFrames))
+    B = np.zeros((nFormReq,nFrames))
+    audio = lfilter([1., -.975], 1, audio) 
+    frames = frame_signal(audio,nWin,nStep)
+    win = hamming(nWin)
+    for b in range(0,frames.shape[0],FRAME_BLOCK):
+        wAudio = frames[b:b+FRAME_BLOCK]*win
+        k = wAudio.shape[0]
+        a = lpc_batch(wAudio,order)
+        Fb, Bb = formant_slots(lpc_roots(a),sr,nFormReq,maxFreq,minFreq,maxBandwidth)
+        F[:,b:b+k] = Fb.T
+        B[:,b:b+k] = Bb.T
+    return F, B
+
+# Implementacao original, quadro a quadro, mantida como referencia
+def format_lpc_ref(audio,sr, nFormReq=4, maxFreq = 4000, winlen=0.01, winstep=0.01):
+    from scipy.signal import lfilter
+    from scipy.signal.windows import hamming
     if (0.5*sr > maxFreq):
         nForm = int(0.5*sr/1000)
     if (0.5*sr < maxFreq):
@@ -68,3 +171,21 @@ def format_lpc(audio,sr, nFormReq=4, maxFreq = 4000, winlen=0.01, winstep=0.01):
     #     B = np.concatenate((B,np.zeros((nFormReq-nForm,nFrames))),axis=0)
     return F, B
 
+def intensity_ref(audio,sr, winlen=0.025, winstep=0.01):
+    from scipy.signal import lfilter, fftconvolve
+    from scipy.signal.windows import kaiser
+    nWin = int(winlen*sr)
+    nStep = int(winstep*sr)
+    # audio = np.concatenate((audio,np.zeros((nWin,))))
+    nPts = len(audio)
+    nFrames = int((nPts-nWin)/nStep + 1)
+    I = np.zeros((nFrames,))
+    
+    # G = np.zeros(nFrames,)
+    k = 0
+    audio = lfilter([1., -.975], 1, audio) 
+    for j in range(0,nPts-nWin,nStep):    
+        Ia = fftconvolve(audio[j:j+nWin]**2,kaiser(nWin, beta=20),mode='same')
+        I[k] = 20*np.log10(np.mean(Ia)/2e-5)
+        k = k+1
+    return I
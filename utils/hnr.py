@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""
+Relação harmônico-ruído (HNR) pela autocorrelação de Boersma (1993).
+
+Reproduz get_HNR de Signal_Analysis.features.signal (mesmos parâmetros,
+mesma divisão em quadros, mesma escolha de picos de peakutils.indexes), mas
+com a autocorrelação por FFT de todos os quadros de mesmo comprimento em uma
+única chamada. Em vez de exceções, o resultado traz o motivo da falha:
+
+    HNRResult(value, reason)
+
+value é o HNR médio em dB (0 se nenhum quadro é sonoro, como em get_HNR) ou
+None quando o trecho não pode ser analisado; reason é um de HNR_OK,
+HNR_UNVOICED, HNR_EMPTY e HNR_SHORT_STEP.
+
+Referências:
+http://www.fon.hum.uva.nl/david/ba_shs/2010/Boersma_Proceedings_1993.pdf
+https://github.com/praat/praat/blob/master/fon/Sound_to_Harmonicity.cpp
+"""
+from collections import namedtuple
+from functools import lru_cache
+import numpy as np
+
+HNRResult = namedtuple('HNRResult', ['value', 'reason'])
+
+HNR_OK = 'ok'
+# Nenhum quadro sonoro: value = 0, como em get_HNR
+HNR_UNVOICED = 'unvoiced'
+# Trecho sem amostras
+HNR_EMPTY = 'empty'
+# time_step menor que uma amostra
+HNR_SHORT_STEP = 'short_step'
+
+# -----------------------------------------------------------------------------
+def peak_indexes(y, thres=0.3):
+    '''
+    Índices dos picos de y acima de thres (relativo à faixa de y), com o
+    tratamento de platôs de peakutils.indexes (min_dist = 1).
+    '''
+    thres = thres * (np.max(y) - np.min(y)) + np.min(y)
+    dy = np.diff(y)
+    zeros, = np.where(dy == 0)
+    if len(zeros) == len(y) - 1:
+        return np.array([], dtype=np.int64)
+    if len(zeros):
+        zeros_diff = np.diff(zeros)
+        zeros_diff_not_one, = np.add(np.where(zeros_diff != 1), 1)
+        zero_plateaus = np.split(zeros, zeros_diff_not_one)
+        if zero_plateaus[0][0] == 0:
+            dy[zero_plateaus[0]] = dy[zero_plateaus[0][-1] + 1]
+            zero_plateaus.pop(0)
+        if len(zero_plateaus) and zero_plateaus[-1][-1] == len(dy) - 1:
+            dy[zero_plateaus[-1]] = dy[zero_plateaus[-1][0] - 1]
+            zero_plateaus.pop(-1)
+        for plateau in zero_plateaus:
+            median = np.median(plateau)
+            dy[plateau[plateau < median]] = dy[plateau[0] - 1]
+            dy[plateau[plateau >= median]] = dy[plateau[-1] + 1]
+    return np.where((np.hstack([dy, 0.0]) < 0.0) & (np.hstack([0.0, dy]) > 0.0) & (y > thres))[0]
+# -----------------------------------------------------------------------------
+@lru_cache(maxsize=64)
+def window_autocorr(N, rate, min_pitch):
+    '''
+    Janela de Hanning de N amostras, sua autocorrelação (calculada como em
+    get_HNR) e a máscara dos lags admitidos, na escala de tempo de get_HNR
+    (linspace até N/rate), entre 1/max_pitch e 1/min_pitch.
+    '''
+    window = np.hanning(N)
+    x_fft = np.fft.fft(window, n=2 ** int(np.log2(N) + 1))
+    r_w = np.nan_to_num(np.real(np.fft.fft(x_fft * np.conjugate(x_fft)))[:N])
+    time_array = np.linspace(0, N / float(rate), N)
+    lags = (time_array >= 1.0 / (rate / 2.0)) * (time_array <= 1.0 / min_pitch)
+    return window, r_w, lags
+# -----------------------------------------------------------------------------
+def hnr_best(frames, rate, min_pitch=75):
+    '''
+    Melhor candidato sonoro de cada linha de frames (quadros de mesmo
+    comprimento): o maior pico da autocorrelação normalizada entre 1/max_pitch
+    e 1/min_pitch, ou -inf se não há pico ou o quadro é nulo. Retorna também
+    o pico local |x - média(x)| de cada quadro, usado em voiced_strengths.
+    '''
+    nFrames, N = frames.shape
+    best = np.full((nFrames,), -np.inf)
+    if (nFrames == 0) or (N == 0):
+        return best, np.zeros((nFrames,))
+    segment = frames - frames.mean(axis=1, keepdims=True)
+    local_peak = np.max(np.abs(segment), axis=1)
+    live = (local_peak != 0)
+    segment = segment[live]
+    window, r_w, lags = window_autocorr(N, rate, min_pitch)
+    segment = segment * window
+    x_fft = np.fft.fft(segment, n=2 ** int(np.log2(N) + 1), axis=1)
+    r_a = np.nan_to_num(np.real(np.fft.fft(x_fft * np.conjugate(x_fft), axis=1))[:, :N])
+    r_x = r_a / r_w
+    r_x /= r_x[:, :1]
+    # Picos por diferença de primeira ordem; linhas com platôs seguem o
+    # tratamento completo de peak_indexes
+    thres = 0.3 * (np.max(r_x, axis=1) - np.min(r_x, axis=1)) + np.min(r_x, axis=1)
+    dy = np.diff(r_x, axis=1)
+    peaks = np.zeros(r_x.shape, dtype=bool)
+    peaks[:, 1:-1] = (dy[:, 1:] < 0) * (dy[:, :-1] > 0)
+    peaks = peaks * (r_x > thres[:, None]) * lags
+    for k in np.nonzero(np.any(dy == 0, axis=1))[0]:
+        peaks[k] = False
+        peaks[k, peak_indexes(r_x[k])] = True
+        peaks[k] = peaks[k] * lags
+    values = np.where(r_x > 1.0, 1.0 / r_x, r_x)
+    values = np.where(peaks, values, -np.inf)
+    best[live] = np.max(values, axis=1)
+    return best, local_peak
+# -----------------------------------------------------------------------------
+def voiced_strengths(best, local_peak, global_peak, silence_threshold=.1):
+    '''
+    Força de cada quadro a partir de hnr_best: o melhor candidato, ou 0.5
+    (HNR de 0 dB) se o candidato surdo vence ou o quadro é nulo. O candidato
+    surdo depende da intensidade do quadro em relação a global_peak.
+    '''
+    cands = np.full(best.shape, 0.5)
+    live = (local_peak != 0)
+    intensity = local_peak[live] / global_peak
+    unvoiced = np.maximum(0, 2 - intensity / silence_threshold)
+    best = best[live]
+    voiced = (best >= unvoiced)
+    cands[np.nonzero(live)[0][voiced]] = best[voiced]
+    return cands
+# -----------------------------------------------------------------------------
+def hnr_strengths(frames, rate, global_peak, min_pitch=75, silence_threshold=.1):
+    '''
+    Força do melhor candidato de cada linha de frames (quadros de mesmo
+    comprimento): o maior pico da autocorrelação normalizada entre 1/max_pitch
+    e 1/min_pitch, ou 0.5 (HNR de 0 dB) se o candidato surdo vence ou o
+    quadro é nulo.
+    '''
+    best, local_peak = hnr_best(frames, rate, min_pitch)
+    return voiced_strengths(best, local_peak, global_peak, silence_threshold)
+# -----------------------------------------------------------------------------
+def mean_hnr(cands):
+    '''
+    HNR médio em dB dos candidatos sonoros (> 0.5), eq. 4 de Boersma; 0 se
+    não houver nenhum.
+    '''
+    cands = np.asarray(cands)
+    cands = cands[cands > 0.5]
+    if (len(cands) == 0):
+        return 0
+    return np.mean(10.0 * np.log10(cands / (1.0 - cands)))
+# -----------------------------------------------------------------------------
+def get_hnr(signal, rate, time_step=0, min_pitch=75, silence_threshold=.1, periods_per_window=4.5):
+    '''
+    HNR médio do sinal, com os mesmos parâmetros e resultado de get_HNR
+    (Signal_Analysis), retornado como HNRResult.
+    '''
+    if min_pitch <= 0:
+        raise ValueError("min_pitch has to be greater than zero.")
+    if silence_threshold < 0 or silence_threshold > 1:
+        raise ValueError("silence_threshold isn't in [ 0, 1 ].")
+    signal = np.asarray(signal, dtype=np.float64)
+    if (len(signal) == 0):
+        return HNRResult(None, HNR_EMPTY)
+    if time_step <= 0:
+        time_step = (periods_per_window / 4.0) / min_pitch
+    frame_len = int(periods_per_window / float(min_pitch) * rate)
+    t_len = int(time_step * rate)
+    if (t_len == 0):
+        return HNRResult(None, HNR_SHORT_STEP)
+    global_peak = np.max(np.abs(signal - signal.mean()))
+    num_frames = max(1, int(len(signal) / t_len + .5))
+    starts = np.arange(num_frames + 1) * t_len
+    ends = np.minimum(starts + frame_len, len(signal))
+    starts, ends = starts[starts < ends], ends[starts < ends]
+    # Quadros inteiros em lote; os do final, mais curtos, um a um
+    nFull = int(np.sum(ends - starts == frame_len))
+    cands = []
+    if (nFull > 0):
+        frames = np.lib.stride_tricks.sliding_window_view(signal, frame_len)[starts[:nFull]]
+        cands.append(hnr_strengths(frames, rate, global_peak, min_pitch, silence_threshold))
+    for a, b in zip(starts[nFull:], ends[nFull:]):
+        cands.append(hnr_strengths(signal[None, a:b], rate, global_peak, min_pitch, silence_threshold))
+    value = mean_hnr(np.concatenate(cands))
+    return HNRResult(value, HNR_OK if value != 0 else HNR_UNVOICED)
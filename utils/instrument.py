@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+Medição de tempo por etapa e contadores para o processamento em P00.
+
+Cada arquivo usa um Instrument próprio:
+
+    inst = Instrument(enabled)
+    with inst.stage('format_lpc'):
+        ...
+    inst.count('intervalos')
+
+Desativado, stage() devolve sempre o mesmo contexto vazio e count() não faz
+nada, então o custo é o de uma chamada de método. As medidas de cada arquivo
+(stats()) são objetos simples, que voltam dos processos do pool junto com o
+resultado e são juntadas no relatório final por build_report().
+"""
+import json
+import time
+from contextlib import nullcontext
+
+_NULL = nullcontext()
+
+class _Timer(object):
+    __slots__ = ('times', 'tIni')
+
+    def __init__(self, times):
+        self.times = times
+
+    def __enter__(self):
+        self.tIni = time.perf_counter()
+        return self
+
+    def __exit__(self, *args):
+        self.times.append(time.perf_counter() - self.tIni)
+
+class Instrument(object):
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.times = {}
+        self.counts = {}
+
+    def stage(self, name):
+        if not self.enabled:
+            return _NULL
+        return _Timer(self.times.setdefault(name, []))
+
+    def count(self, name, n=1):
+        if self.enabled:
+            self.counts[name] = self.counts.get(name, 0) + n
+
+    def stats(self):
+        '''
+        Medidas do arquivo: {'times': {etapa: [duração de cada chamada]},
+        'counts': {contador: valor}}, ou None se desativado.
+        '''
+        if not self.enabled:
+            return None
+        return {'times': self.times, 'counts': self.counts}
+# -----------------------------------------------------------------------------
+def percentile(values, p):
+    values = sorted(values)
+    if (len(values) == 0):
+        return 0.0
+    k = min(len(values) - 1, max(0, int(round(p/100.0*(len(values) - 1)))))
+    return values[k]
+# -----------------------------------------------------------------------------
+def build_report(files, nSlowest=10):
+    '''
+    Relatório da execução a partir das medidas de cada arquivo
+    (Instrument.stats() acrescido de 'file', 'seconds' = tempo de
+    processamento do arquivo, 'intervals' e 'audioSeconds').
+    '''
+    times = {}
+    counts = {}
+    for f in files:
+        for name, values in f['times'].items():
+            times.setdefault(name, []).extend(values)
+        for name, value in f['counts'].items():
+            counts[name] = counts.get(name, 0) + value
+    stages = {}
+    for name, values in times.items():
+        total = sum(values)
+        stages[name] = {'calls': len(values), 'total': total,
+                        'mean': total/len(values) if values else 0.0,
+                        'p95': percentile(values, 95)}
+    perFile = []
+    for f in files:
+        seconds = max(f['seconds'], 1e-12)
+        perFile.append({'file': f['file'], 'seconds': f['seconds'],
+                        'intervals': f['intervals'], 'audioSeconds': f['audioSeconds'],
+                        'intervalsPerSecond': f['intervals']/seconds,
+                        'audioSecondsPerSecond': f['audioSeconds']/seconds})
+    totalSeconds = sum(f['seconds'] for f in perFile)
+    return {'files': len(perFile),
+            'seconds': totalSeconds,
+            'intervalsPerSecond': sum(f['intervals'] for f in perFile)/max(totalSeconds, 1e-12),
+            'audioSecondsPerSecond': sum(f['audioSeconds'] for f in perFile)/max(totalSeconds, 1e-12),
+            'stages': dict(sorted(stages.items(), key=lambda kv: -kv[1]['total'])),
+            'counts': counts,
+            'slowestFiles': sorted(perFile, key=lambda f: -f['seconds'])[:nSlowest]}
+# -----------------------------------------------------------------------------
+def write_report(filename, report):
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
@@ -47,6 +47,108 @@ def lpc_ref(signal, order):
     else:
         return np.ones(1, dtype = signal.dtype)
 
+def autocorr_batch(frames, order):
+    """Compute the autocorrelation lags 0..order of every row of frames.
+
+    Parameters
+    ----------
+
+    frames: array_like
+        2-D array, one signal frame per row
+    order : int
+        highest lag (the output will have order + 1 columns)
+
+    Note
+    ----
+
+    Row i of the result is equal to the lags 0..order of
+    np.correlate(frames[i], frames[i], 'full'), as used by lpc_ref."""
+    frames = np.atleast_2d(frames)
+    nx = frames.shape[1]
+    r = np.zeros((frames.shape[0], order + 1), frames.dtype)
+    for k in range(min(order + 1, nx)):
+        r[:, k] = np.einsum('ij,ij->i', frames[:, :nx - k], frames[:, k:])
+    return r
+
+def levinson_batch(r, order):
+    """Levinson-Durbin recursion for a batch of autocorrelation vectors.
+
+    Vectorized counterpart of levinson_1d: the recursion runs once over the
+    order, and each step updates every row of r with array operations.
+
+    Arguments
+    ---------
+        r : array-like
+            2-D array, one autocorrelation vector (lags 0..order) per row
+        order : int
+            LPC order
+
+    Returns
+    -------
+        a : prediction coefficients, shape (rows, order + 1), a[:, 0] = 1
+        e : prediction error of each row
+        k : reflection coefficients, shape (rows, order)
+
+    Note
+    ----
+    Rows with r[:, 0] <= 0 (zero energy) do not raise as in levinson_1d:
+    they get a = [1, 0, ..., 0], k = 0 and e = r[:, 0]."""
+    r = np.atleast_2d(r)
+    if r.ndim > 2:
+        raise ValueError("Array of rank > 2 not supported")
+    n = r.shape[0]
+    if order > r.shape[1] - 1:
+        raise ValueError("Order should be <= size-1")
+
+    a = np.zeros((n, order+1), r.dtype)
+    k = np.zeros((n, order), r.dtype)
+    a[:, 0] = 1.
+    e = r[:, 0].copy()
+    voiced = e > 0
+    # Zero-energy rows divide by 1 and keep k = 0
+    for i in range(1, order+1):
+        acc = r[:, i] + np.einsum('ij,ij->i', a[:, 1:i], r[:, i-1:0:-1])
+        ki = np.where(voiced, -acc / np.where(voiced, e, 1.), 0.)
+        k[:, i-1] = ki
+        a[:, 1:i] += ki[:, np.newaxis] * a[:, i-1:0:-1]
+        a[:, i] = ki
+        e *= 1 - ki * ki
+
+    return a, e, k
+
+def lpc_batch(frames, order):
+    """Compute the Linear Prediction Coefficients of every row of frames.
+
+    Batched counterpart of lpc_ref: all autocorrelations are computed at once
+    and the normal equations of every frame are solved together by
+    levinson_batch instead of one explicit Toeplitz inverse per frame.
+
+    Parameters
+    ----------
+
+    frames: array_like
+        2-D array, one signal frame per row
+    order : int
+        LPC order (the output will have order + 1 columns)
+
+    Note
+    ----
+
+    Unlike lpc_ref, an all-zero frame does not raise: its coefficients are
+    [1, 0, ..., 0], i.e. no formant candidates."""
+    frames = np.atleast_2d(frames)
+    if frames.ndim > 2:
+        raise ValueError("Array of rank > 2 not supported")
+    if order > frames.shape[1]:
+        raise ValueError("Input signal must have a lenght >= lpc order")
+
+    nFrames = frames.shape[0]
+    if order > 0:
+        a, _, _ = levinson_batch(autocorr_batch(frames, order), order)
+        return a
+    else:
+        return np.ones((nFrames, 1), dtype = frames.dtype)
+
 def levinson_1d(r, order):
     """Levinson-Durbin recursion, to efficiently solve symmetric linear systems
     with toeplitz structure.
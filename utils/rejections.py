@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+Registro dos intervalos descartados no processamento de P00.
+
+Em vez de imprimir uma mensagem para cada intervalo descartado, cada descarte
+é guardado como (arquivo, intervalo, início, fim, código, etiqueta, detalhe).
+Os registros de cada arquivo voltam junto com o resultado, são gravados de uma
+vez no arquivo de descartes e, ao final, só a contagem por código é impressa.
+Com verbose = True cada descarte também é impresso na hora, como antes.
+"""
+from collections import Counter
+
+# Códigos dos descartes (mesma numeração das mensagens antigas de P00)
+REJECTION_CODES = {
+    1: "segmento muito curto para processamento",
+    2: "número de marcações da etiqueta diferente de 5",
+    3: "HNR não pode ser calculado",
+    4: "silabificação diferente do número de sílabas da etiqueta",
+    5: "posição maior que o número de sílabas",
+    6: "falha na estimação da posição da sílaba",
+    7: "sílaba sem vogal",
+    8: "marcação que não é vogal",
+    9: "número de sílabas (TAG 2) inválido",
+    10: "número de sílabas (TAG 2) vazio",
+    11: "posição da sílaba (TAG 4) inválida",
+    13: "problema na detecção da tag",
+}
+
+REJECTION_HEADER = ["Arquivo", "ID", "Inicio", "Fim", "Codigo", "Etiqueta", "Detalhe"]
+
+class RejectionLog(object):
+    def __init__(self, fileName, verbose=False):
+        self.fileName = fileName
+        self.verbose = verbose
+        self.records = []
+
+    def add(self, code, idx, interval, detail=''):
+        '''
+        Registra o descarte do intervalo idx ([início, fim, etiqueta]) com o
+        código code e um detalhe opcional.
+        '''
+        self.records.append((self.fileName, idx, interval[0], interval[1], code, interval[2], detail))
+        if self.verbose:
+            print("{:}: Etiqueta {:} ID {:}: {:}{:}".format(code, interval[2], idx, REJECTION_CODES[code],
+                                                             " ({:})".format(detail) if detail else ""))
+            print("{:}: Arquivo {:} no intervalo entre {:2.3f} e {:2.3f} segundos.".format(code, self.fileName, interval[0], interval[1]))
+# -----------------------------------------------------------------------------
+def rejection_summary(counts):
+    '''
+    Tabela de texto com o número de descartes por código, a partir de um
+    Counter {código: quantidade}.
+    '''
+    lines = ["{:>6} {:>8}  {:}".format("Código", "Total", "Motivo")]
+    for code in sorted(counts):
+        lines.append("{:>6} {:>8}  {:}".format(code, counts[code], REJECTION_CODES.get(code, "")))
+    lines.append("{:>6} {:>8}".format("", sum(counts.values())))
+    return "\n".join(lines)
+# -----------------------------------------------------------------------------
+def count_rejections(records, counts=None):
+    counts = Counter() if (counts is None) else counts
+    counts.update(record[4] for record in records)
+    return counts
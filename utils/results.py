@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""
+Resultados parciais por arquivo para execuções incrementais.
+
+Cada par (TextGrid, WAV) processado tem suas linhas gravadas em um arquivo
+JSON próprio na pasta de resultados, e o manifesto (manifest.jsonl) registra,
+para cada par, o caminho, o tamanho, o mtime e o SHA-1 das duas entradas e a
+versão do código. Ao reexecutar, um par é reaproveitado se a versão é a mesma
+e as entradas não mudaram: tamanho e mtime iguais bastam; o SHA-1 só é
+recalculado quando um deles difere (ex.: arquivo copiado ou tocado).
+
+O manifesto é um arquivo de linhas JSON em que cada par concluído acrescenta
+uma linha (a última vence), de modo que uma interrupção não perde o que já foi
+gravado. Ele é compactado em save().
+
+As linhas podem conter escalares do numpy (ex.: np.int64 na posição da sílaba),
+gravados como int e float.
+"""
+import hashlib
+import json
+import os
+from pathlib import Path
+
+MANIFEST = 'manifest.jsonl'
+
+def file_sha1(path, block=2**20):
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for data in iter(lambda: f.read(block), b''):
+            digest.update(data)
+    return digest.hexdigest()
+
+def json_value(value):
+    '''
+    Conversão dos valores do numpy (escalares e vetores) para json.dump.
+    '''
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    raise TypeError("Object of type {:} is not JSON serializable".format(type(value).__name__))
+
+def code_version(paths, params=()):
+    '''
+    Versão do código: SHA-1 dos arquivos-fonte em paths e dos parâmetros de
+    configuração que alteram os resultados.
+    '''
+    digest = hashlib.sha1()
+    for path in sorted(paths):
+        with open(path, 'rb') as f:
+            digest.update(hashlib.sha1(f.read()).digest())
+    digest.update(repr(tuple(params)).encode('utf-8'))
+    return digest.hexdigest()
+
+class ResultCache(object):
+    def __init__(self, folder, version):
+        self.folder = Path(folder)
+        self.folder.mkdir(parents=True, exist_ok=True)
+        self.version = version
+        self.manifestFile = self.folder / MANIFEST
+        self.entries = {}
+        # Hashes já calculados nesta execução, por (caminho, tamanho, mtime)
+        self.hashes = {}
+        if self.manifestFile.exists():
+            with open(self.manifestFile, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # Linha incompleta de uma execução interrompida
+                        continue
+                    self.entries[entry['key']] = entry
+
+    @staticmethod
+    def key(tgFile, audioFile):
+        return os.path.abspath(tgFile) + '|' + os.path.abspath(audioFile)
+
+    def _signature(self, path, old=None):
+        st = os.stat(path)
+        sig = {'path': os.path.abspath(path), 'size': st.st_size, 'mtime': st.st_mtime_ns}
+        stamp = (sig['path'], sig['size'], sig['mtime'])
+        if (old is not None) and (old['size'] == sig['size']) and (old['mtime'] == sig['mtime']):
+            sig['sha1'] = old['sha1']
+        elif stamp in self.hashes:
+            sig['sha1'] = self.hashes[stamp]
+        else:
+            sig['sha1'] = self.hashes[stamp] = file_sha1(path)
+        return sig
+
+    def _result_file(self, key):
+        name = Path(key.split('|')[0]).stem
+        return self.folder / '{:}_{:}.json'.format(name, hashlib.sha1(key.encode('utf-8')).hexdigest()[:10])
+
+    def _append(self, entry):
+        self.entries[entry['key']] = entry
+        with open(self.manifestFile, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+
+    def get(self, tgFile, audioFile):
+        '''
+        Retorna o dicionário gravado por put() se o par não mudou desde então,
+        ou None.
+        '''
+        key = self.key(tgFile, audioFile)
+        entry = self.entries.get(key)
+        if (entry is None) or (entry['version'] != self.version):
+            return None
+        try:
+            if any(os.path.getsize(p) != old['size'] for p, old in zip((tgFile, audioFile), entry['inputs'])):
+                return None
+            inputs = [self._signature(p, old) for p, old in zip((tgFile, audioFile), entry['inputs'])]
+            if any(new['sha1'] != old['sha1'] for new, old in zip(inputs, entry['inputs'])):
+                return None
+            with open(self._result_file(key), encoding='utf-8') as f:
+                result = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if (inputs != entry['inputs']):
+            # Conteúdo igual com novo mtime: atualiza para não recalcular o hash
+            self._append(dict(entry, inputs=inputs))
+        result['rows'] = [tuple(row) for row in result['rows']]
+        return result
+
+    def put(self, tgFile, audioFile, **result):
+        key = self.key(tgFile, audioFile)
+        old = self.entries.get(key, {}).get('inputs', (None, None))
+        inputs = [self._signature(p, o) for p, o in zip((tgFile, audioFile), old)]
+        resultFile = self._result_file(key)
+        tmpFile = resultFile.with_suffix('.tmp')
+        with open(tmpFile, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, default=json_value)
+        os.replace(tmpFile, resultFile)
+        self._append({'key': key, 'version': self.version, 'inputs': inputs,
+                      'result': resultFile.name})
+
+    def save(self):
+        '''
+        Reescreve o manifesto com uma linha por par.
+        '''
+        tmpFile = self.manifestFile.with_suffix('.tmp')
+        with open(tmpFile, 'w', encoding='utf-8') as f:
+            for entry in self.entries.values():
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        os.replace(tmpFile, self.manifestFile)
@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+"""
+Leitura em fluxo (streaming) de arquivos .TextGrid do praat.
+
+O arquivo é lido linha a linha e convertido em uma sequência de tokens
+(textos entre aspas, números e marcadores como <exists>). Os formatos longo
+("ooTextFile") e curto possuem a mesma sequência de tokens, diferindo apenas
+nos rótulos (xmin =, intervals [1]:, ...), que são ignorados. O formato
+cronológico ("Praat chronological TextGrid text file") também é aceito.
+
+Os intervalos são gerados camada por camada. Camadas fora do filtro são
+percorridas sem criar nenhum objeto.
+"""
+import re
+from collections import namedtuple
+
+# Camada do arquivo. size é o número de itens e items o gerador dos itens
+# (None nas camadas não selecionadas).
+TextGridTier = namedtuple('TextGridTier', ['index', 'name', 'tierClass', 'xmin', 'xmax', 'size', 'items'])
+# Item de uma camada. Em camadas de pontos (TextTier) xmax é None.
+TextGridItem = namedtuple('TextGridItem', ['tier', 'name', 'tierClass', 'xmin', 'xmax', 'text'])
+
+TOKEN = re.compile(r'"((?:[^"]|"")*)"|\[[^\]]*\]|(<[a-z]+>)|([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)|(!.*)')
+
+NUMBER_START = frozenset('0123456789+-.')
+
+CHRONOLOGICAL = 'Praat chronological TextGrid text file'
+# -----------------------------------------------------------------------------
+def sniff_encoding(filename):
+    # Praat grava em UTF-8 ou UTF-16 (com BOM)
+    with open(filename, 'rb') as file:
+        bom = file.read(4)
+    if bom.startswith((b'\xff\xfe', b'\xfe\xff')):
+        return 'utf-16'
+    return 'utf-8-sig'
+# -----------------------------------------------------------------------------
+def textgrid_tokens(lines):
+    '''
+    Gera os tokens de uma sequência de linhas: textos entre aspas como str,
+    números como float e marcadores como <exists> como tupla (marcador,).
+    Índices entre colchetes, rótulos e comentários (!) são ignorados.
+    Textos com quebra de linha são reunidos antes da separação.
+    '''
+    pending = ''
+    for line in lines:
+        if pending:
+            line = pending + line
+        # Número ímpar de aspas: texto continua na próxima linha
+        if (line.count('"') % 2):
+            pending = line
+            continue
+        pending = ''
+        # Caminhos rápidos: linha com rótulos e números (xmin = 0.7) e no
+        # máximo um texto simples (text = "a"). Índices como [1]: são ignorados.
+        if not ('<' in line or '!' in line):
+            nQuotes = line.count('"')
+            if (nQuotes == 0):
+                for piece in line.split():
+                    if (piece[0] in NUMBER_START):
+                        yield float(piece)
+                continue
+            if (nQuotes == 2):
+                first = line.index('"')
+                last = line.rindex('"')
+                for piece in line[:first].split():
+                    if (piece[0] in NUMBER_START):
+                        yield float(piece)
+                yield line[first+1:last]
+                for piece in line[last+1:].split():
+                    if (piece[0] in NUMBER_START):
+                        yield float(piece)
+                continue
+        for match in TOKEN.finditer(line):
+            text, flag, number, _ = match.groups()
+            if text is not None:
+                yield text.replace('""', '"')
+            elif number is not None:
+                yield float(number)
+            elif flag is not None:
+                yield (flag,)
+    if pending:
+        raise ValueError('Texto entre aspas sem fechamento no arquivo textgrid')
+# -----------------------------------------------------------------------------
+def _next(tokens):
+    # Arquivo truncado ou vazio: ValueError, como os demais erros de leitura
+    # (um StopIteration dentro de um gerador viraria RuntimeError, PEP 479)
+    token = next(tokens, None)
+    if token is None:
+        raise ValueError('Fim inesperado do arquivo textgrid')
+    return token
+# -----------------------------------------------------------------------------
+def _selected(tiers, index, name):
+    return (tiers is None) or (index in tiers) or (name in tiers)
+# -----------------------------------------------------------------------------
+def _read_items(tokens, idxT, name, tierClass, nItems, consumed):
+    isInterval = (tierClass == 'IntervalTier')
+    nextToken = tokens.__next__
+    for k in range(nItems):
+        try:
+            xmin = nextToken()
+            xmax = nextToken() if isInterval else None
+            text = nextToken()
+        except StopIteration:
+            raise ValueError('Fim inesperado do arquivo textgrid') from None
+        consumed[0] = k + 1
+        yield TextGridItem(idxT, name, tierClass, xmin, xmax, text)
+# -----------------------------------------------------------------------------
+def _full_tiers(tokens, tiers):
+    # Formatos longo e curto: camadas em sequência
+    _next(tokens)                     # xmin
+    _next(tokens)                     # xmax
+    if (_next(tokens) != ('<exists>',)):
+        return
+    nTiers = int(_next(tokens))
+    for idxT in range(nTiers):
+        tierClass = _next(tokens)
+        name = _next(tokens)
+        xmin = _next(tokens)
+        xmax = _next(tokens)
+        nItems = int(_next(tokens))
+        consumed = [0]
+        if _selected(tiers, idxT, name):
+            items = _read_items(tokens, idxT, name, tierClass, nItems, consumed)
+            yield TextGridTier(idxT, name, tierClass, xmin, xmax, nItems, items)
+            items.close()
+        else:
+            yield TextGridTier(idxT, name, tierClass, xmin, xmax, nItems, None)
+        # Descarta os itens não lidos pelo chamador
+        nTokens = (3 if (tierClass == 'IntervalTier') else 2)*(nItems - consumed[0])
+        for _ in range(nTokens):
+            _next(tokens)
+# -----------------------------------------------------------------------------
+def _chronological_tiers(tokens, tiers):
+    # Formato cronológico: itens de todas as camadas intercalados no tempo,
+    # por isso os itens das camadas selecionadas são guardados até o fim
+    _next(tokens)                     # xmin
+    _next(tokens)                     # xmax
+    nTiers = int(_next(tokens))
+    tierDefs = []
+    for idxT in range(nTiers):
+        tierClass = _next(tokens)
+        name = _next(tokens)
+        xmin = _next(tokens)
+        xmax = _next(tokens)
+        tierDefs.append((tierClass, name, xmin, xmax))
+    items = [[] if _selected(tiers, idxT, tierDefs[idxT][1]) else None
+             for idxT in range(nTiers)]
+    sizes = [0]*nTiers
+    for number in tokens:
+        idxT = int(number) - 1
+        tierClass, name, _, _ = tierDefs[idxT]
+        xmin = _next(tokens)
+        xmax = _next(tokens) if (tierClass == 'IntervalTier') else None
+        text = _next(tokens)
+        sizes[idxT] += 1
+        if items[idxT] is not None:
+            items[idxT].append(TextGridItem(idxT, name, tierClass, xmin, xmax, text))
+    for idxT, (tierClass, name, xmin, xmax) in enumerate(tierDefs):
+        tierItems = items[idxT]
+        yield TextGridTier(idxT, name, tierClass, xmin, xmax, sizes[idxT],
+                           None if tierItems is None else iter(tierItems))
+# -----------------------------------------------------------------------------
+def iter_textgrid_tiers(filename, tiers=None, encoding=None):
+    '''
+    filename:  endereço completo do arquivo .textgrid (formato longo, curto ou
+               cronológico)
+    tiers:     índices (a partir de 0) e/ou nomes das camadas desejadas.
+               Se tiers=None (padrão) todas as camadas são lidas.
+    encoding:  codificação do arquivo. Se None, detecta UTF-16 pelo BOM ou
+               usa UTF-8.
+    Gera um TextGridTier para cada camada do arquivo, em ordem. Em camadas
+    selecionadas, items é um gerador de TextGridItem que deve ser percorrido
+    antes de avançar para a próxima camada (o que não for lido é descartado).
+    Em camadas não selecionadas, items é None e seus itens são apenas pulados.
+    '''
+    if encoding is None:
+        encoding = sniff_encoding(filename)
+    with open(filename, 'r', encoding=encoding) as file:
+        tokens = textgrid_tokens(file)
+        fileType = _next(tokens)
+        if (fileType == CHRONOLOGICAL):
+            yield from _chronological_tiers(tokens, tiers)
+            return
+        if not (isinstance(fileType, str) and fileType.startswith('ooTextFile')):
+            raise ValueError('Arquivo textgrid indica que não é do tipo TextFile.')
+        if (_next(tokens) != 'TextGrid'):
+            raise ValueError('Arquivo textgrid indica conteúdo não é do tipo TextGrid.')
+        yield from _full_tiers(tokens, tiers)
+# -----------------------------------------------------------------------------
+def iter_textgrid(filename, tiers=None, encoding=None):
+    '''
+    Gera um TextGridItem por intervalo (ou ponto) das camadas selecionadas,
+    camada por camada. Parâmetros como em iter_textgrid_tiers.
+    '''
+    for tier in iter_textgrid_tiers(filename, tiers=tiers, encoding=encoding):
+        if tier.items is not None:
+            yield from tier.items
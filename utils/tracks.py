@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""
+Trilhas de características calculadas uma única vez por arquivo ("track mode").
+
+Em vez de chamar format_lpc e intensity em cada trecho audio[nIni:nFim], as
+trilhas de formantes, larguras de banda e intensidade são calculadas sobre o
+arquivo inteiro em uma grade fixa de winstep segundos. Cada intervalo
+etiquetado é respondido pelos quadros da grade que cabem inteiros dentro dele.
+
+O sinal pode ser um vetor ou um AudioReader (utils.audio); nos dois casos ele
+é lido em blocos de blockLen segundos, sem montar o arquivo inteiro em float.
+
+A trilha de HNR guarda o melhor candidato sonoro e o pico local de cada
+quadro (utils.hnr.hnr_best) em quadros de hnrPeriods/75 s na mesma grade. Em
+hnr(), como em get_hnr, a escolha entre o candidato sonoro e o surdo usa o pico
+do trecho pedido, e os quadros mais curtos do final do trecho são calculados na
+hora e somados aos da grade.
+
+O HNR não é equivalente ao de get_hnr: os quadros inteiros são os da grade, e
+não quadros a partir do início do trecho. No corpus sintético
+(benchmarks.corpus) a diferença é de cerca de 4% em média e chega a 25%.
+Formantes e intensidade também usam os quadros da grade.
+"""
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from .formant_lpc import format_lpc, intensity
+from .hnr import hnr_best, voiced_strengths, mean_hnr, HNRResult, HNR_OK, HNR_UNVOICED
+
+# Aviso gravado junto com a saída quando as trilhas são usadas
+TRACK_HNR_NOTE = ("HNR aproximado (TRACK_MODE): quadros da grade do arquivo, diferença "
+                  "média de 4% (até 25%) em relação a get_hnr")
+
+class FeatureTracks(object):
+    def __init__(self, audio, sr, winstep=0.005, winlen=0.020, blockLen=60.0, hnrPeriods=1.875):
+        self.sr = sr
+        self.nWin = int(winlen*sr)
+        self.nStep = int(winstep*sr)
+        if hasattr(audio,'segment'):
+            nPts, segment = audio.nSamples, audio.segment
+        else:
+            nPts, segment = len(audio), lambda a, b: audio[a:b]
+        # Mesmo número de quadros de format_lpc/intensity no sinal inteiro
+        nFrames = int((nPts-self.nWin)/self.nStep + 1)
+        self.F = np.zeros((4,nFrames))
+        self.B = np.zeros((4,nFrames))
+        self.I = np.zeros((nFrames,))
+        # Cada bloco começa um quadro antes para que a pré-ênfase da primeira
+        # amostra use a amostra anterior; esse quadro extra é descartado.
+        nBlock = max(1,int(blockLen*sr/self.nStep))*self.nStep
+        for s in range(0,max(nPts-self.nWin,0),nBlock):
+            skip = 1 if (s > 0) else 0
+            x = segment(s-skip*self.nStep,min(nPts,s+nBlock+self.nWin))
+            k = len(range(0,len(x)-self.nWin,self.nStep)) - skip
+            k = min(k,nBlock//self.nStep)
+            F, B = format_lpc(x,sr,winstep=winstep,winlen=winlen)
+            I = intensity(x,sr,winstep=winstep,winlen=winlen)
+            q = s//self.nStep
+            self.F[:,q:q+k] = F[:,skip:skip+k]
+            self.B[:,q:q+k] = B[:,skip:skip+k]
+            self.I[q:q+k] = I[skip:skip+k]
+        self.hnrLen = int(hnrPeriods/75.0*sr)
+        # Trechos do sinal para o pico de cada intervalo em hnr()
+        self.segment = segment
+        self.HBest, self.HPeak = self._hnr_track(nPts, segment, nBlock)
+
+    def _hnr_track(self, nPts, segment, nBlock):
+        nFrames = max(0,(nPts - self.hnrLen)//self.nStep + 1)
+        best = np.full((nFrames,),-np.inf)
+        peak = np.zeros((nFrames,))
+        for s in range(0,nFrames*self.nStep,nBlock):
+            x = segment(s,min(nPts,s+nBlock+self.hnrLen))
+            frames = sliding_window_view(x,self.hnrLen)[::self.nStep][:nBlock//self.nStep]
+            q = s//self.nStep
+            best[q:q+len(frames)], peak[q:q+len(frames)] = hnr_best(frames,self.sr)
+        return best, peak
+
+    def frames(self, tIni, tFim, nWin=None):
+        '''
+        Retorna o slice dos quadros da grade, de nWin amostras (padrão: as
+        janelas de formantes e intensidade), que começam em tIni ou depois e
+        terminam em tFim ou antes.
+        '''
+        nWin = self.nWin if (nWin is None) else nWin
+        nIni = int(np.ceil(tIni*self.sr/self.nStep))
+        nFim = int(np.floor((tFim*self.sr - nWin)/self.nStep)) + 1
+        return slice(nIni, max(nIni,nFim))
+
+    def formants(self, tIni, tFim):
+        sel = self.frames(tIni,tFim)
+        return self.F[:,sel], self.B[:,sel]
+
+    def intensity(self, tIni, tFim):
+        return self.I[self.frames(tIni,tFim)]
+
+    def hnr(self, tIni, tFim):
+        # Pico de |x - media(x)| e quadros finais mais curtos do trecho, como
+        # em get_hnr com time_step = winstep
+        x = self.segment(int(tIni*self.sr),int(tFim*self.sr))
+        peak = np.max(np.abs(x - np.mean(x))) if (len(x) > 0) else 0.0
+        sel = self.frames(tIni,tFim,self.hnrLen)
+        best, local = [self.HBest[sel]], [self.HPeak[sel]]
+        starts = np.arange(max(1,int(len(x)/self.nStep + .5)) + 1)*self.nStep
+        ends = np.minimum(starts + self.hnrLen, len(x))
+        for a, b in zip(starts, ends):
+            if (a < b) and (b - a < self.hnrLen):
+                bb, pp = hnr_best(x[None,a:b],self.sr)
+                best.append(bb)
+                local.append(pp)
+        value = mean_hnr(voiced_strengths(np.concatenate(best),np.concatenate(local),peak))
+        return HNRResult(value, HNR_OK if value != 0 else HNR_UNVOICED)
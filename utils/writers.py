@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""
+Escrita da tabela de saída linha a linha.
+
+As linhas são gravadas no arquivo à medida que são produzidas (com buffer e
+descarga periódica), então a memória não cresce com o tamanho do corpus.
+
+TsvWriter grava texto separado por tabulações; ParquetWriter grava um arquivo
+Parquet colunar com tipos explícitos, em grupos de linhas. O pyarrow só é
+necessário (e importado) quando o ParquetWriter é usado.
+"""
+import csv
+
+class TsvWriter(object):
+    '''
+    Tabela separada por tabulações, escrita pelo módulo csv: campos com
+    tabulação, aspas ou quebra de linha são colocados entre aspas. Com
+    precision = None os números reais são escritos com todos os dígitos
+    (repr), senão com precision casas decimais.
+    '''
+    def __init__(self, filename, header, precision=None, flushEvery=1000, delimiter='\t'):
+        self.file = open(filename, 'w', newline='', encoding='utf-8', buffering=2**16)
+        self.writer = csv.writer(self.file, delimiter=delimiter, lineterminator='\n')
+        self.floatFormat = repr if (precision is None) else ('{:.' + str(int(precision)) + 'f}').format
+        self.flushEvery = flushEvery
+        self.nRows = 0
+        self.writer.writerow(header)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _format(self, value):
+        if isinstance(value, float):
+            return self.floatFormat(float(value))
+        return value
+
+    def writerow(self, row):
+        self.writer.writerow([self._format(v) for v in row])
+        self.nRows = self.nRows + 1
+        if (self.nRows % self.flushEvery == 0):
+            self.file.flush()
+
+    def writerows(self, rows):
+        for row in rows:
+            self.writerow(row)
+
+    def close(self):
+        if not self.file.closed:
+            self.file.close()
+
+# Tipos aceitos por ParquetWriter: nome -> construtor do tipo no pyarrow
+ARROW_TYPES = {
+    'int8': lambda pa: pa.int8(),
+    'int16': lambda pa: pa.int16(),
+    'int32': lambda pa: pa.int32(),
+    'int64': lambda pa: pa.int64(),
+    'float32': lambda pa: pa.float32(),
+    'float64': lambda pa: pa.float64(),
+    'string': lambda pa: pa.string(),
+    'category': lambda pa: pa.dictionary(pa.int32(), pa.string()),
+}
+
+class ParquetWriter(object):
+    '''
+    Tabela Parquet com o esquema dado por header e types (nomes de
+    ARROW_TYPES; 'category' vira uma coluna de dicionário). As linhas ficam
+    em buffer por coluna e são gravadas a cada rowGroup linhas, como um grupo
+    de linhas do arquivo. metadata (dicionário de textos) é gravado nos
+    metadados do esquema.
+    '''
+    def __init__(self, filename, header, types, rowGroup=65536, compression='zstd', metadata=None):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("A saída Parquet requer o pacote pyarrow (pip install pyarrow)")
+        if (len(header) != len(types)):
+            raise ValueError("header e types devem ter o mesmo número de colunas")
+        self.pa = pa
+        self.schema = pa.schema([pa.field(name, ARROW_TYPES[t](pa)) for name, t in zip(header, types)],
+                                metadata=metadata)
+        self.file = pq.ParquetWriter(filename, self.schema, compression=compression)
+        self.rowGroup = rowGroup
+        self.columns = [[] for _ in header]
+        self.nRows = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def writerow(self, row):
+        for col, value in zip(self.columns, row):
+            col.append(value)
+        self.nRows = self.nRows + 1
+        if (len(self.columns[0]) >= self.rowGroup):
+            self.flush()
+
+    def writerows(self, rows):
+        for row in rows:
+            self.writerow(row)
+
+    def flush(self):
+        if (len(self.columns[0]) == 0):
+            return
+        pa = self.pa
+        arrays = []
+        for col, field in zip(self.columns, self.schema):
+            if pa.types.is_dictionary(field.type):
+                arrays.append(pa.array(col, type=pa.string()).dictionary_encode())
+            else:
+                arrays.append(pa.array(col, type=field.type))
+        self.file.write_table(pa.Table.from_arrays(arrays, schema=self.schema))
+        self.columns = [[] for _ in self.columns]
+
+    def close(self):
+        if (self.file is not None):
+            self.flush()
+            self.file.close()
+            self.file = None